@@ -0,0 +1,217 @@
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TARGET_SLUG = "siriusxm-hits-1"
+NEXT_ICON_PATH = "M8.293 4.293a1 1 0 0 1 1.414 0l7 7a1 1 0 0 1 0 1.414l-7 7"
+
+PAGE_TEMPLATE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>SiriusXM fixture</title>
+<style>
+  .hidden {{ display: none; }}
+  [data-qa="content-overlay-modal"], #onetrust-banner-sdk {{ position: fixed; inset: 20% 20%; background: #fff; border: 1px solid #000; }}
+  .carousel-page a {{ display: inline-block; margin: 4px; }}
+</style></head>
+<body>{body}
+<script>const CONFIG = {config};</script>
+<script>{script}</script>
+</body></html>"""
+
+HOME_BODY = """
+<nav data-componenttype="Global Nav">
+  <button aria-label="Discover" aria-expanded="false">Discover</button>
+  <a href="/player/home"><div class="rl2_button-module_content_4PKD6">Start Listening</div></a>
+</nav>"""
+
+HOME_SCRIPT = """
+const discover = document.querySelector("button[aria-label='Discover']");
+discover.addEventListener('click', () => setTimeout(() => {
+  discover.setAttribute('aria-expanded', String(discover.getAttribute('aria-expanded') !== 'true'));
+}, CONFIG.uiDelayMs));"""
+
+LOGIN_BODY = """
+<form onsubmit="return false">
+  <input data-qa="email-field" type="email">
+  <button data-qa="submit-auth-email">Continue</button>
+</form>
+<div id="error" class="hidden">We can't find a match for that email</div>
+<div id="onetrust-banner-sdk" class="hidden"><button id="onetrust-accept-btn-handler">Accept</button></div>
+<div data-qa="content-overlay-modal" class="hidden">
+  <div id="auth-options">
+    <div data-qa="password-auth-option">Sign in with password</div>
+    <button data-qa="submit-auth-option">Continue</button>
+  </div>
+  <form data-qa="password-auth-form" class="hidden" onsubmit="return false">
+    <input data-qa="password-field" type="password">
+    <button data-qa="sign-in">Continue</button>
+  </form>
+</div>"""
+
+LOGIN_SCRIPT = """
+const $ = s => document.querySelector(s);
+const show = (s, on = true) => $(s).classList.toggle('hidden', !on);
+let cookiesAccepted = !CONFIG.cookieBanner;
+$("button[data-qa='submit-auth-email']").addEventListener('click', () => setTimeout(() => {
+  if (!cookiesAccepted) { show('#onetrust-banner-sdk'); return; }
+  if ($("input[data-qa='email-field']").value.startsWith('unknown')) { show('#error'); return; }
+  if (CONFIG.authModal) { show("[data-qa='content-overlay-modal']"); }
+}, CONFIG.uiDelayMs));
+$('#onetrust-accept-btn-handler').addEventListener('click', () => { cookiesAccepted = true; show('#onetrust-banner-sdk', false); });
+$("button[data-qa='submit-auth-option']").addEventListener('click', () => setTimeout(() => {
+  show('#auth-options', false); show("form[data-qa='password-auth-form']");
+}, CONFIG.uiDelayMs));
+$("button[data-qa='sign-in']").addEventListener('click', () => { location.href = '/player/home'; });"""
+
+PLAYER_HOME_BODY = """
+<nav>
+  <a data-qa="content-nav-music" href="/player/home/music">Music</a>
+  <a data-qa="content-nav-for-you" href="/player/home/for-you">For You</a>
+</nav>
+<main id="carousels"></main>"""
+
+PLAYER_HOME_SCRIPT = """
+const root = document.getElementById('carousels');
+const forYou = document.querySelector('a[data-qa="content-nav-for-you"]');
+function renderCarousel(el, data, page) {
+  const start = page * CONFIG.perPage;
+  const links = data.links.slice(start, start + CONFIG.perPage)
+    .map(l => `<a href="${l.href}">${l.slug}</a>`).join('');
+  const last = start + CONFIG.perPage >= data.links.length;
+  el.innerHTML = `<div class="carousel-page">${links}</div>
+    <button ${last ? 'disabled' : ''}><svg viewBox="0 0 24 24"><path d="${CONFIG.nextIcon}"></path></svg></button>`;
+  el.querySelector('button').addEventListener('click', () => setTimeout(() => renderCarousel(el, data, page + 1), CONFIG.uiDelayMs));
+}
+function renderForYou() {
+  root.innerHTML = '';
+  CONFIG.carousels.forEach((data, c) => {
+    const el = document.createElement('section');
+    el.setAttribute('data-qa', `content-carousel-${c}`);
+    root.appendChild(el);
+    renderCarousel(el, data, 0);
+  });
+}
+document.querySelector('a[data-qa="content-nav-music"]').addEventListener('click', e => {
+  e.preventDefault(); root.innerHTML = '';
+});
+forYou.addEventListener('click', e => {
+  e.preventDefault();
+  setTimeout(() => { forYou.setAttribute('href', `/player/home/for-you/${CONFIG.forYouId}`); renderForYou(); }, CONFIG.uiDelayMs);
+});
+if (location.pathname.startsWith('/player/home/for-you')) renderForYou();"""
+
+CHANNEL_BODY = """
+<h1 id="channel"></h1>
+<button aria-label="Play">Play</button>"""
+
+CHANNEL_SCRIPT = """
+document.getElementById('channel').textContent = location.pathname.split('/')[3];
+const btn = document.querySelector('button[aria-label]');
+btn.addEventListener('click', () => {
+  const playing = btn.getAttribute('aria-label') === 'Play';
+  btn.setAttribute('aria-label', playing ? 'Pause' : 'Play');
+  btn.textContent = playing ? 'Pause' : 'Play';
+});"""
+
+
+class FixtureSite:
+    """
+    Local stand-in for www.siriusxm.com that renders the same data-qa selectors the page
+    objects use, with a configurable number of carousels, links and Next-button pages.
+    Point the page objects at it with base_url=site.base_url.
+    """
+
+    def __init__(self, carousels: int = 5, links_per_carousel: int = 20, pages_per_carousel: int = 2,
+                 cookie_banner: bool = True, auth_modal: bool = True, latency_ms: int = 0, ui_delay_ms: int = 0):
+        self.carousels = carousels
+        self.links_per_carousel = links_per_carousel
+        self.pages_per_carousel = pages_per_carousel
+        self.cookie_banner = cookie_banner
+        self.auth_modal = auth_modal
+        self.latency_ms = latency_ms
+        self.ui_delay_ms = ui_delay_ms
+        self.requests = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def channel_links(self) -> list:
+        """Carousel contents; the target channel sits on the last page of the last carousel (worst case)."""
+        carousels = []
+        for c in range(self.carousels):
+            links = []
+            for i in range(self.links_per_carousel):
+                slug = f"channel-{c}-{i}"
+                if c == self.carousels - 1 and i == self.links_per_carousel - 1:
+                    slug = TARGET_SLUG
+                channel_id = uuid.uuid5(uuid.NAMESPACE_URL, slug)
+                links.append({"slug": slug, "href": f"/player/channel-linear/{slug}/{channel_id}"})
+            carousels.append({"links": links})
+        return carousels
+
+    def render(self, path: str):
+        """Returns the HTML for a path, or None for a 404."""
+        config = {
+            "uiDelayMs": self.ui_delay_ms,
+            "cookieBanner": self.cookie_banner,
+            "authModal": self.auth_modal,
+        }
+        if path == "/":
+            body, script = HOME_BODY, HOME_SCRIPT
+        elif path == "/player/login":
+            body, script = LOGIN_BODY, LOGIN_SCRIPT
+        elif path.startswith("/player/home"):
+            body, script = PLAYER_HOME_BODY, PLAYER_HOME_SCRIPT
+            config.update({
+                "carousels": self.channel_links(),
+                "perPage": -(-self.links_per_carousel // self.pages_per_carousel),
+                "nextIcon": NEXT_ICON_PATH,
+                "forYouId": str(uuid.uuid5(uuid.NAMESPACE_URL, "for-you")),
+            })
+        elif path.startswith("/player/channel-linear/"):
+            body, script = CHANNEL_BODY, CHANNEL_SCRIPT
+        else:
+            return None
+        return PAGE_TEMPLATE.format(body=body, config=json.dumps(config), script=script)
+
+    def start(self) -> "FixtureSite":
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.requests += 1
+                if site.latency_ms:
+                    time.sleep(site.latency_ms / 1000)
+                html = site.render(self.path.split("?", 1)[0])
+                status = 200 if html is not None else 404
+                payload = (html or "Not found").encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
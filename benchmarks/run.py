@@ -0,0 +1,157 @@
+"""
+Benchmarks the page-object hot paths against the local fixture site.
+
+    python -m benchmarks.run                          # run and compare against benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline          # record a new baseline
+    python -m benchmarks.run --sizes 5x20x2,20x60x6   # carousels x links-per-carousel x pages
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from playwright.sync_api import sync_playwright
+from benchmarks.fixture_site import FixtureSite, TARGET_SLUG
+from pages.for_you_page import ForYouPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from utils.ipc_counter import count_ipc
+
+DEFAULT_SIZES = "3x10x1,5x20x2,10x40x4,20x60x6"
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _for_you(page, site):
+    page.goto(f"{site.base_url}/player/home")
+    for_you_page = ForYouPage(page, base_url=site.base_url)
+    for_you_page.click_for_you_nav()
+    return for_you_page
+
+
+def _login(page, site):
+    login_page = LoginPage(page, base_url=site.base_url)
+    login_page.goto()
+    return login_page
+
+
+def _home(page, site):
+    home_page = HomePage(page, base_url=site.base_url)
+    home_page.goto()
+    return home_page
+
+
+# name -> (setup(page, site) -> page object, measured call)
+CASES = {
+    "ForYouPage.click_channel_by_href": (_for_you, lambda po: po.click_channel_by_href(TARGET_SLUG)),
+    "ForYouPage.click_first_player_link": (_for_you, lambda po: po.click_first_player_link()),
+    "LoginPage.submit_username": (_login, lambda po: po.submit_username("bench@example.com")),
+    "HomePage.click_discover_button": (_home, lambda po: po.click_discover_button()),
+}
+
+
+def parse_sizes(spec: str) -> list:
+    sizes = []
+    for item in spec.split(","):
+        carousels, links, pages = (int(n) for n in item.strip().split("x"))
+        sizes.append((carousels, links, pages))
+    return sizes
+
+
+def run_case(browser, site, name, repeat):
+    setup, call = CASES[name]
+    timings, round_trips = [], []
+    for _ in range(repeat):
+        context = browser.new_context()
+        page = context.new_page()
+        try:
+            page_object = setup(page, site)
+            with count_ipc() as ipc:
+                start = time.perf_counter()
+                call(page_object)
+                timings.append((time.perf_counter() - start) * 1000)
+            round_trips.append(ipc.round_trips)
+        finally:
+            context.close()
+    return {"median_ms": statistics.median(timings), "min_ms": min(timings), "round_trips": max(round_trips)}
+
+
+def run(sizes, repeat, latency_ms, cases) -> dict:
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            for carousels, links, pages in sizes:
+                size_key = f"{carousels}x{links}x{pages}"
+                with FixtureSite(carousels, links, pages, latency_ms=latency_ms) as site:
+                    for name in cases:
+                        print(f"⏱️ {name} @ {size_key} ...")
+                        results[f"{name}@{size_key}"] = run_case(browser, site, name, repeat)
+        finally:
+            browser.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, time_threshold: float, ipc_threshold: float) -> list:
+    """Returns human-readable regressions: slower than baseline by time_threshold, or more round trips."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        if current["median_ms"] > base["median_ms"] * (1 + time_threshold):
+            regressions.append(f"{key}: {current['median_ms']:.1f} ms vs baseline {base['median_ms']:.1f} ms")
+        if current["round_trips"] > base["round_trips"] * (1 + ipc_threshold):
+            regressions.append(f"{key}: {current['round_trips']} round trips vs baseline {base['round_trips']}")
+    return regressions
+
+
+def print_table(results: dict, baseline: dict):
+    print(f"\n{'case':<52}{'median ms':>11}{'min ms':>9}{'IPC':>7}{'base ms':>10}{'base IPC':>10}")
+    for key, r in results.items():
+        base = baseline.get(key, {})
+        print(f"{key:<52}{r['median_ms']:>11.1f}{r['min_ms']:>9.1f}{r['round_trips']:>7}"
+              f"{base.get('median_ms', float('nan')):>10.1f}{base.get('round_trips', '-'):>10}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated carousels x links x pages")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=int, default=0, help="Latency injected into every fixture response")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Only run these cases")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--time-threshold", type=float, default=0.25, help="Allowed slowdown ratio (0.25 = +25%%)")
+    parser.add_argument("--ipc-threshold", type=float, default=0.0, help="Allowed round-trip increase ratio")
+    parser.add_argument("--output", help="Also write the results JSON here")
+    args = parser.parse_args(argv)
+
+    results = run(parse_sizes(args.sizes), args.repeat, args.latency_ms, args.case or list(CASES))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.time_threshold, args.ipc_threshold)
+    for line in regressions:
+        print(f"❌ Regression: {line}")
+    if not regressions:
+        print("✅ No regressions against baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
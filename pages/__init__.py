@@ -0,0 +1,4 @@
+import os
+
+# Point the page objects at another host (e.g. the benchmark fixture site)
+BASE_URL = os.getenv("SIRIUSXM_BASE_URL", "https://www.siriusxm.com").rstrip("/")
@@ -0,0 +1,146 @@
+from urllib.parse import urljoin
+from playwright.async_api import Page
+from pages import BASE_URL
+from pages.for_you_page import ForYouPage
+from utils.playback_metrics import COLLECT_JS, FIRST_AUDIO_JS, PLAYBACK_METRICS_JS, summarize
+from utils.web_vitals import vitals
+from utils.waits import settle_async
+
+
+# playwright.async_api twin of ForYouPage; shares its in-page scripts and selectors
+class AsyncForYouPage(ForYouPage):
+    def __init__(self, page: Page, base_url: str = BASE_URL):
+        super().__init__(page, base_url)
+
+    async def click_for_you_nav(self):
+        print("Clicking Music nav item to reset selection...")
+        await self.page.click('a[data-qa="content-nav-music"]')
+        await settle_async(self.page, label="music nav", timeout=3000)
+
+        print("Clicking For You nav item...")
+        async with vitals.navigation_async(self.page, "for you"):
+            await self.page.click('a[data-qa="content-nav-for-you"]')
+            await settle_async(self.page, label="for you nav", timeout=5000, predicate=self.FOR_YOU_UUID_JS)
+
+        updated_href = await self.page.locator('a[data-qa="content-nav-for-you"]').get_attribute("href")
+        print(f"✅ For You nav href updated: {updated_href}")
+
+    async def click_first_matching_channel(self, channel_slugs: list, max_scrolls: int = 10):
+        """Clicks the highest-priority channel slug found in any carousel; returns the slug or None."""
+        await self.content.refresh_async()
+        slug = await self._open_indexed(channel_slugs)
+        if slug:
+            return slug
+
+        print(f"🔍 Looking for hrefs matching (in priority order): {', '.join(channel_slugs)}")
+        rank = await self._scan_and_click(self._slug_patterns(channel_slugs),
+                                          'a[href*="/player/channel-linear/"]', max_scrolls)
+        if rank is None:
+            print(f"❌ None of the channels {channel_slugs} found in any carousel.")
+            return None
+        return channel_slugs[rank]
+
+    async def _open_indexed(self, channel_slugs: list):
+        for slug in channel_slugs:
+            entry = self.content.get(slug)
+            if not entry:
+                continue
+            print(f"📇 {slug} found in content payload (carousel {entry['carousel']!r}, position {entry['position'] + 1})")
+            await self._open_href(entry["href"])
+            if not entry["built"]:
+                return slug
+            if await self._channel_loaded(entry["href"]):
+                self.content.confirm(slug)
+                return slug
+            self.content.drop(slug)
+            await self.page.go_back()
+        return None
+
+    async def _open_href(self, href: str):
+        async with vitals.navigation_async(self.page, "channel"):
+            if not await self.page.evaluate(self.CLICK_HREF_JS, href):
+                print("⚠️ Link not rendered. Navigating to it directly.")
+                await self.page.goto(urljoin(self.page.url, href))
+
+    async def click_channel_by_href(self, channel_slug: str, max_scrolls: int = 10) -> bool:
+        return await self.click_first_matching_channel([channel_slug], max_scrolls) is not None
+
+    async def click_first_player_link(self, max_scrolls: int = 10) -> bool:
+        print(f"🔍 Fallback: searching carousels for any /player/ link.")
+        if await self._scan_and_click([r"/player/.+/.+"], 'a[href*="/player/"]', max_scrolls) is None:
+            print("❌ No fallback clickable link found.")
+            return False
+        return True
+
+    async def _scan_and_click(self, patterns: list, link_selector: str, max_scrolls: int):
+        best = None
+        for attempt in range(max_scrolls):
+            next_selectors, scan_args = self._scan_args(patterns, link_selector, attempt, max_scrolls)
+            result = await self.page.evaluate(self.SCAN_CAROUSELS_JS, scan_args)
+            best, keep_paging = self._fold_scan(result, next_selectors, attempt, best)
+            if not keep_paging:
+                break
+            await settle_async(self.page, label="carousel page", quiet_ms=150, timeout=2000, network=False)
+
+        if best is None:
+            return None
+
+        print(f"🔍 Clicking link: {best['href']} (carousel {best['carousel'] + 1})")
+        await self._open_href(best["href"])
+        return best["rank"]
+
+    async def channel_exists(self, channel_slug: str) -> bool:
+        locator = self.page.locator(f'a[href*="/player/channel-linear/{channel_slug}/"]')
+        return await locator.count() > 0
+
+    async def get_channel_href(self, channel_slug: str) -> str:
+        locator = self.page.locator(f'a[href*="/player/channel-linear/{channel_slug}/"]').first
+        return await locator.get_attribute("href")
+
+    async def get_channel_hrefs(self) -> dict:
+        await self.content.refresh_async()
+        return {**self.content.hrefs(), **self._channel_map(await self.page.evaluate(self.CHANNEL_HREFS_JS))}
+
+    async def goto_channel(self, href: str, timeout: int = 5000) -> bool:
+        async with vitals.navigation_async(self.page, "channel"):
+            await self.page.goto(urljoin(self.base_url, href))
+        return await self._channel_loaded(href, timeout)
+
+    async def _channel_loaded(self, href: str, timeout: int = 5000) -> bool:
+        try:
+            await self.page.locator('button[aria-label^="Play"]:visible').first.wait_for(state="visible", timeout=timeout)
+        except Exception as e:
+            print(f"⚠️ Channel page did not load from {href}: {e}")
+            return False
+        return href.rstrip("/") in self.page.url
+
+    async def start_playback_metrics(self):
+        await self.page.add_init_script(PLAYBACK_METRICS_JS)
+        await self.page.evaluate(PLAYBACK_METRICS_JS)
+
+    async def get_playback_metrics(self, wait_for_audio: int = 0) -> dict:
+        if wait_for_audio:
+            try:
+                await self.page.wait_for_function(FIRST_AUDIO_JS, timeout=wait_for_audio)
+            except Exception:
+                print(f"⚠️ Audio did not start within {wait_for_audio} ms")
+        metrics = summarize(await self.page.evaluate(COLLECT_JS))
+        print(f"🎧 Playback: first audio {metrics['time_to_first_audio_ms']} ms, {metrics['stalls']} stall(s), "
+              f"{metrics['segments']} segment(s) / {metrics['segment_bytes'] / 1024:.0f} KB")
+        return metrics
+
+    async def force_dismiss_playback_stalled_modal(self) -> bool:
+        try:
+            modal = self.page.locator('[data-qa="content-overlay-modal"]')
+            await modal.wait_for(state="visible", timeout=3000)
+            print("🧪 Modal is visible. Looking for 'Try again' button...")
+
+            try_again_button = modal.locator("button", has_text="Try again")
+            await try_again_button.scroll_into_view_if_needed(timeout=2000)
+            await try_again_button.wait_for(state="visible", timeout=2000)
+            await try_again_button.click()
+            print("✅ Clicked 'Try again' to dismiss modal.")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not dismiss modal: {e}")
+            return False
@@ -0,0 +1,29 @@
+from playwright.async_api import Page
+from pages import BASE_URL
+from pages.home_page import HomePage
+from utils.selector_registry import selector_registry
+from utils.web_vitals import vitals
+
+
+# playwright.async_api twin of HomePage: same selectors, same methods, awaitable
+class AsyncHomePage(HomePage):
+    def __init__(self, page: Page, base_url: str = BASE_URL):
+        super().__init__(page, base_url)
+
+    async def goto(self):
+        async with vitals.navigation_async(self.page, "home"):
+            await self.page.goto(f"{self.base_url}/")
+
+    async def is_nav_visible(self):
+        nav = await selector_registry.resolve_async(self.page, "home.global_nav", timeout=10000)
+        return await nav.is_visible()
+
+    async def click_start_listening(self):
+        button = await selector_registry.resolve_async(self.page, "home.start_listening", timeout=10000)
+        await button.click()
+
+    async def click_discover_button(self):
+        discover = await selector_registry.resolve_async(self.page, "home.discover_button", timeout=7000)
+        await discover.click()
+        await discover.and_(self.page.locator("[aria-expanded='true']")).wait_for(state="visible", timeout=7000)
+        return True
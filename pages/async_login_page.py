@@ -0,0 +1,196 @@
+import time
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from pages import BASE_URL
+from pages.locators import LOCATORS
+from pages.login_page import LoginPage
+from utils.artifacts import artifacts
+from utils.selector_registry import selector_registry
+from utils.waits import settle_async
+from utils.watchdog import watchdog
+from utils.web_vitals import vitals
+
+
+# playwright.async_api twin of LoginPage: same selectors, same methods, awaitable
+class AsyncLoginPage(LoginPage):
+    def __init__(self, page: Page, base_url: str = BASE_URL):
+        super().__init__(page, base_url)
+
+    async def goto(self):
+        """Navigate to the SiriusXM login page."""
+        async with vitals.navigation_async(self.page, "login"):
+            await self.page.goto(f"{self.base_url}/player/login")
+
+    async def submit_username(self, username: str):
+        """Enter the username and handle cookie modal and error or auth method modal."""
+        try:
+            await self.page.wait_for_selector(self.username_input, timeout=10000)
+            await self.page.fill(self.username_input, username)
+            print(f"Filled username: {username}")
+
+            if watchdog.watching(self.page):
+                await self._continue_watched()
+            else:
+                await self._continue_and_accept_cookies()
+
+            if await self.page.locator(self.auth_method_container).is_visible():
+                print("Auth method modal is visible.")
+            elif await self.page.locator(self.error_message).is_visible():
+                print("Invalid username error is shown.")
+            else:
+                raise Exception("Neither modal nor error message appeared after submitting username.")
+
+        except Exception as e:
+            print("Failed to submit username. Saving screenshot for debugging.")
+            await artifacts.capture_async(self.page, "username_input_failure", full_page=False)
+            raise e
+
+    async def _continue_and_accept_cookies(self):
+        await self.page.locator(self.username_continue_button).click()
+        print("Clicked continue after entering username...")
+
+        outcome = self.page.locator(self.auth_method_container).or_(self.page.locator(self.error_message))
+        for cookie_selector in LOCATORS["login.cookie_accept"]:
+            outcome = outcome.or_(self.page.locator(cookie_selector))
+        await outcome.first.wait_for(state="visible", timeout=10000)
+        await settle_async(self.page, label="username submit", timeout=2000)
+
+        cookie_button = await selector_registry.find_async(self.page, "login.cookie_accept")
+        if cookie_button:
+            print("Cookie banner detected. Accepting cookies...")
+            await cookie_button.click()
+            await cookie_button.wait_for(state="hidden", timeout=5000)
+
+            print("Re-clicking username continue to reopen modal...")
+            await self.page.locator(self.username_continue_button).click()
+            await (self.page.locator(self.auth_method_container)
+                   .or_(self.page.locator(self.error_message))
+                   .first.wait_for(state="visible", timeout=10000))
+
+    async def _continue_watched(self, timeout: int = 10000, slice_ms: int = 1000):
+        cookie_banner = watchdog.handler("cookie banner")
+        outcome = self.page.locator(self.auth_method_container).or_(self.page.locator(self.error_message)).first
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            dismissed = cookie_banner.fires
+            await self.page.locator(self.username_continue_button).click()
+            print("Clicked continue after entering username...")
+            while True:
+                try:
+                    await outcome.wait_for(state="visible", timeout=slice_ms)
+                    return
+                except PlaywrightTimeoutError:
+                    if time.monotonic() >= deadline:
+                        raise
+                if cookie_banner.fires > dismissed or await cookie_banner.locator(self.page).first.is_visible():
+                    print("Cookie banner came up. Re-clicking username continue to reopen modal...")
+                    break
+
+    async def is_invalid_username(self) -> bool:
+        """Check if the invalid username message is visible."""
+        try:
+            return await self.page.locator(self.error_message).is_visible()
+        except:
+            return False
+
+    async def choose_password_method(self):
+        """Select the 'Sign in with password' option and proceed to the password modal."""
+        try:
+            print("Waiting for auth method modal...")
+            await self.page.locator(self.auth_method_container).wait_for(state="visible", timeout=15000)
+
+            print("Selecting password authentication option via data-qa selector...")
+            password_option = self.page.locator(self.password_auth_option)
+            await password_option.wait_for(state="visible", timeout=5000)
+            await password_option.scroll_into_view_if_needed()
+            await password_option.click(force=True, timeout=5000)
+
+            print("Clicking Continue to confirm auth method...")
+            continue_button = self.page.locator(self.auth_continue_button)
+            await continue_button.wait_for(state="visible", timeout=5000)
+            await continue_button.click(force=True, timeout=5000)
+
+            print("Waiting for password entry modal...")
+            await self.page.wait_for_selector("form[data-qa='password-auth-form']", timeout=10000)
+
+        except Exception as e:
+            print("Failed during auth method selection flow.")
+            await artifacts.capture_async(self.page, "auth_modal_continue_failure")
+            raise e
+
+    async def enter_password_and_submit(self, password: str):
+        """Enter the password and click the final Continue button."""
+        try:
+            await self.page.wait_for_selector(self.password_input, timeout=7000)
+            await self.page.fill(self.password_input, password)
+            await self.page.click(self.final_continue_button)
+        except Exception as e:
+            print("Password entry or submission failed. Saving screenshot.")
+            await artifacts.capture_async(self.page, "password_failure", full_page=False)
+            raise e
+
+    async def login(self, username: str, password: str, mode: str = None):
+        """Sign in via the API fast path or the UI; see LoginPage.login."""
+        mode = mode or self.login_mode
+        start = time.perf_counter()
+        path = "ui"
+        if mode == "api" and not self.auth_api_url:
+            raise AssertionError("mode='api' needs SIRIUSXM_AUTH_API_URL to be set.")
+        if mode in ("auto", "api") and self.auth_api_url:
+            if await self.api_login(username, password):
+                path = "api"
+            elif mode == "api":
+                raise AssertionError("API login failed and UI fallback is disabled (mode='api').")
+            else:
+                print("⚠️ API login failed. Falling back to the UI flow...")
+        if path == "ui":
+            await self.ui_login(username, password)
+
+        self.last_login = {"path": path, "ms": (time.perf_counter() - start) * 1000}
+        print(f"🔐 Logged in via {path} in {self.last_login['ms']:.0f} ms")
+
+    async def api_login(self, username: str, password: str, timeout: int = 10000) -> bool:
+        try:
+            response = await self.page.context.request.post(
+                self.auth_api_url,
+                data={"handle": username, "password": password},
+                headers={"Origin": self.base_url, "Referer": f"{self.base_url}/player/login"},
+                timeout=timeout,
+            )
+            if not response.ok:
+                print(f"⚠️ Auth API answered {response.status} {response.status_text}")
+                return False
+            await self._inject_session_cookies(response)
+
+            await self.page.goto(f"{self.base_url}/player/home")
+            return await self._signed_in(timeout)
+        except Exception as e:
+            print(f"⚠️ API login error: {e}")
+            return False
+
+    async def _signed_in(self, timeout: int) -> bool:
+        nav = self.page.locator(self.signed_in_nav)
+        await nav.or_(self.page.locator(self.username_input)).first.wait_for(state="visible", timeout=timeout)
+        return "/player/login" not in self.page.url and await nav.first.is_visible()
+
+    async def _inject_session_cookies(self, response):
+        try:
+            body = await response.json()
+        except Exception:
+            return
+        cookies = body.get("cookies") if isinstance(body, dict) else None
+        if cookies:
+            domain = self.base_url.split("://", 1)[-1].split("/", 1)[0]
+            await self.page.context.add_cookies([
+                {"name": c["name"], "value": c["value"], "domain": c.get("domain", domain), "path": c.get("path", "/")}
+                for c in cookies if "name" in c and "value" in c
+            ])
+
+    async def ui_login(self, username: str, password: str):
+        """Run the full UI login flow and wait until the player home page loads."""
+        await self.goto()
+        await self.submit_username(username)
+        if await self.is_invalid_username():
+            raise AssertionError("Username is not recognized.")
+        await self.choose_password_method()
+        await self.enter_password_and_submit(password)
+        await self.page.wait_for_url("**/player/home", timeout=10000)
@@ -1,138 +1,208 @@
 import re
 import time
+from urllib.parse import urljoin
 from playwright.sync_api import Page
+from pages import BASE_URL
+from utils.content_index import track_content
+from utils.playback_metrics import COLLECT_JS, FIRST_AUDIO_JS, PLAYBACK_METRICS_JS, summarize
+from utils.selector_registry import selector_registry
+from utils.web_vitals import vitals
+from utils.waits import settle
 
 
 class ForYouPage:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, base_url: str = BASE_URL):
         self.page = page
+        self.base_url = base_url
+        # Channels listed in the carousel JSON payloads, including ones not rendered yet
+        self.content = track_content(page)
+
+    FOR_YOU_UUID_JS = """() => /\\/for-you\\/[a-f0-9-]{36}/.test(
+        document.querySelector('a[data-qa="content-nav-for-you"]')?.getAttribute('href') || '')"""
 
     def click_for_you_nav(self):
         print("Clicking Music nav item to reset selection...")
         self.page.click('a[data-qa="content-nav-music"]')
-        self.page.wait_for_timeout(500)
+        settle(self.page, label="music nav", timeout=3000)
 
         print("Clicking For You nav item...")
-        self.page.click('a[data-qa="content-nav-for-you"]')
-        self.page.wait_for_timeout(1000)
+        with vitals.navigation(self.page, "for you"):
+            self.page.click('a[data-qa="content-nav-for-you"]')
+            settle(self.page, label="for you nav", timeout=5000, predicate=self.FOR_YOU_UUID_JS)
 
         # Confirm UUID version of URL is loaded
         updated_href = self.page.locator('a[data-qa="content-nav-for-you"]').get_attribute("href")
         print(f"✅ For You nav href updated: {updated_href}")
 
+    # Scans every carousel in a single round trip: collects hrefs, picks the best
+    # match by pattern priority and optionally pages carousels forward.
+    SCAN_CAROUSELS_JS = """({patterns, linkSelector, nextSelectors, page}) => {
+        const regexes = patterns.map(p => new RegExp('^' + p));
+        const carousels = Array.from(document.querySelectorAll('[data-qa^="content-carousel"]'));
+        const counts = [];
+        let best = null;
+
+        carousels.forEach((carousel, c) => {
+            const links = Array.from(carousel.querySelectorAll(linkSelector));
+            counts.push(links.length);
+            for (const link of links) {
+                const href = link.getAttribute('href') || '';
+                const rank = regexes.findIndex(r => r.test(href));
+                if (rank !== -1 && (best === null || rank < best.rank)) {
+                    best = {rank, href, carousel: c};
+                }
+            }
+        });
+
+        // Next buttons: first selector in the ranked chain that matches wins
+        const findNext = carousel => {
+            for (let s = 0; s < nextSelectors.length; s++) {
+                try {
+                    const next = carousel.querySelector(nextSelectors[s]);
+                    if (next) return {next, s};
+                } catch (e) {}
+            }
+            return null;
+        };
+        let paged = 0;
+        let nextUsed = null;
+        if (page && (best === null || best.rank > 0)) {
+            for (const carousel of carousels) {
+                const found = findNext(carousel);
+                if (!found) continue;
+                if (nextUsed === null || found.s < nextUsed) nextUsed = found.s;
+                if (!found.next.disabled) {
+                    found.next.click();
+                    paged++;
+                }
+            }
+        }
+        return {carousels: carousels.length, counts, best, paged, nextUsed};
+    }"""
+
+    CLICK_HREF_JS = """href => {
+        const el = Array.from(document.querySelectorAll('[data-qa^="content-carousel"] a'))
+            .find(a => a.getAttribute('href') === href);
+        if (!el) return false;
+        el.scrollIntoView({behavior: 'auto', block: 'center'});
+        el.click();
+        return true;
+    }"""
+
+    def click_first_matching_channel(self, channel_slugs: list, max_scrolls: int = 10):
+        """
+        Clicks the highest-priority channel slug found in any carousel.
+        Returns the slug that was clicked, or None if none of them were found.
+        """
+        self.content.refresh()
+        slug = self._open_indexed(channel_slugs)
+        if slug:
+            return slug
+
+        patterns = self._slug_patterns(channel_slugs)
+        print(f"🔍 Looking for hrefs matching (in priority order): {', '.join(channel_slugs)}")
+        rank = self._scan_and_click(patterns, 'a[href*="/player/channel-linear/"]', max_scrolls)
+        if rank is None:
+            print(f"❌ None of the channels {channel_slugs} found in any carousel.")
+            return None
+        return channel_slugs[rank]
+
+    def _open_indexed(self, channel_slugs: list):
+        """
+        Opens the first slug already seen in a content payload, without paging any carousel.
+        An href built from entity fields is only trusted once the channel page loads from it.
+        """
+        for slug in channel_slugs:
+            entry = self.content.get(slug)
+            if not entry:
+                continue
+            print(f"📇 {slug} found in content payload (carousel {entry['carousel']!r}, position {entry['position'] + 1})")
+            self._open_href(entry["href"])
+            if not entry["built"]:
+                return slug
+            if self._channel_loaded(entry["href"]):
+                self.content.confirm(slug)
+                return slug
+            self.content.drop(slug)
+            self.page.go_back()
+        return None
+
+    def _open_href(self, href: str):
+        with vitals.navigation(self.page, "channel"):
+            if not self.page.evaluate(self.CLICK_HREF_JS, href):
+                # Off-screen or paged out of view; navigating to it lands on the same page
+                print("⚠️ Link not rendered. Navigating to it directly.")
+                self.page.goto(urljoin(self.page.url, href))
+
+    @staticmethod
+    def _slug_patterns(channel_slugs: list) -> list:
+        return [rf"/player/channel-linear/{re.escape(slug)}/[a-f0-9-]+" for slug in channel_slugs]
+
     def click_channel_by_href(self, channel_slug: str, max_scrolls: int = 10) -> bool:
         """
         Clicks a channel with a matching slug and UUID-based href from any carousel.
         Example href: /player/channel-linear/siriusxm-hits-1/<uuid>
         """
-        pattern = re.compile(rf"/player/channel-linear/{re.escape(channel_slug)}/[a-f0-9-]+")
-        print(f"🔍 Looking for hrefs matching regex: {pattern.pattern}")
-
-        carousels = self.page.locator('[data-qa^="content-carousel"]')
-        carousel_count = carousels.count()
-        print(f"🎠 Found {carousel_count} carousels.")
-
-        for c in range(carousel_count):
-            print(f"\n➡️ Checking carousel {c + 1} of {carousel_count}")
-            carousel = carousels.nth(c)
-
-            for attempt in range(max_scrolls):
-                links = carousel.locator('a[href*="/player/channel-linear/"]')
-                total_links = links.count()
-                print(f"🔗 Found {total_links} potential link(s) on scroll attempt {attempt + 1}")
-
-                for i in range(total_links):
-                    try:
-                        link = links.nth(i)
-                        element_handle = link.element_handle()
-                        if not element_handle:
-                            continue
-
-                        href = element_handle.get_attribute("href") or ""
-                        if not pattern.match(href):
-                            continue
-
-                        print(f"🔍 Clicking link: {href}")
-                        self.page.evaluate(
-                            """el => {
-                                el.scrollIntoView({behavior: 'auto', block: 'center'});
-                                el.click();
-                            }""",
-                            element_handle
-                        )
-                        return True
-                    except Exception as err:
-                        print(f"⚠️ Skipping link {i} due to error: {err}")
-                        continue
-
-                # Optional: try scrolling carousel forward if needed
-                next_btn = carousel.locator('button:has(svg path[d*="M8.293"])')
-                if next_btn.count() > 0 and next_btn.first.is_enabled():
-                    print("➡️ Clicking Next button to scroll carousel.")
-                    next_btn.first.click()
-                    self.page.wait_for_timeout(500)
-                else:
-                    print("🚫 Next button not available or disabled.")
-                    break
-
-        print(f"❌ Channel with slug '{channel_slug}' not found in any carousel.")
-        return False
+        return self.click_first_matching_channel([channel_slug], max_scrolls) is not None
 
     def click_first_player_link(self, max_scrolls: int = 10) -> bool:
         """
         Fallback: clicks the first visible link in any carousel that contains /player/ in href.
         """
-        pattern = re.compile(r"/player/.+/.+")
-        carousels = self.page.locator('[data-qa^="content-carousel"]')
-        carousel_count = carousels.count()
         print(f"🔍 Fallback: searching carousels for any /player/ link.")
+        if self._scan_and_click([r"/player/.+/.+"], 'a[href*="/player/"]', max_scrolls) is None:
+            print("❌ No fallback clickable link found.")
+            return False
+        return True
+
+    def _scan_and_click(self, patterns: list, link_selector: str, max_scrolls: int):
+        """Returns the index of the pattern that was clicked, or None."""
+        best = None
+        for attempt in range(max_scrolls):
+            next_selectors, scan_args = self._scan_args(patterns, link_selector, attempt, max_scrolls)
+            result = self.page.evaluate(self.SCAN_CAROUSELS_JS, scan_args)
+            best, keep_paging = self._fold_scan(result, next_selectors, attempt, best)
+            if not keep_paging:
+                break
+            settle(self.page, label="carousel page", quiet_ms=150, timeout=2000, network=False)
+
+        if best is None:
+            return None
+
+        print(f"🔍 Clicking link: {best['href']} (carousel {best['carousel'] + 1})")
+        self._open_href(best["href"])
+        return best["rank"]
+
+    @staticmethod
+    def _scan_args(patterns: list, link_selector: str, attempt: int, max_scrolls: int):
+        """The ranked Next selectors and the SCAN_CAROUSELS_JS argument for one scan."""
+        next_selectors = selector_registry.ordered("for_you.next_button")
+        return next_selectors, {
+            "patterns": patterns,
+            "linkSelector": link_selector,
+            "nextSelectors": next_selectors,
+            "page": attempt < max_scrolls - 1,
+        }
+
+    @staticmethod
+    def _fold_scan(result: dict, next_selectors: list, attempt: int, best):
+        """Merges one scan into the best match so far; returns (best, keep_paging)."""
+        if result["nextUsed"] is not None:
+            selector_registry.record("for_you.next_button", next_selectors[result["nextUsed"]], hit=True)
+        print(f"🎠 Scan {attempt + 1}: {result['carousels']} carousels, "
+              f"{sum(result['counts'])} potential link(s)")
+
+        found = result["best"]
+        if found and (best is None or found["rank"] < best["rank"]):
+            best = found
+        if best and best["rank"] == 0:
+            return best, False
+        if not result["paged"]:
+            print("🚫 Next button not available or disabled.")
+            return best, False
+        print(f"➡️ Clicked Next on {result['paged']} carousel(s).")
+        return best, True
 
-        for c in range(carousel_count):
-            print(f"\n➡️ Checking carousel {c + 1} of {carousel_count}")
-            carousel = carousels.nth(c)
-
-            for attempt in range(max_scrolls):
-                links = carousel.locator('a[href*="/player/"]')
-                total_links = links.count()
-                print(f"🔗 Found {total_links} links on scroll attempt {attempt + 1}")
-
-                for i in range(total_links):
-                    try:
-                        link = links.nth(i)
-                        element_handle = link.element_handle()
-                        if not element_handle:
-                            continue
-
-                        href = element_handle.get_attribute("href") or ""
-                        if not pattern.match(href):
-                            continue
-
-                        print(f"🔍 Clicking fallback link: {href}")
-                        self.page.evaluate(
-                            """el => {
-                                el.scrollIntoView({behavior: 'auto', block: 'center'});
-                                el.click();
-                            }""",
-                            element_handle
-                        )
-                        return True
-                    except Exception as err:
-                        print(f"⚠️ Skipping link {i} due to error: {err}")
-                        continue
-
-                # Attempt to scroll carousel forward
-                next_btn = carousel.locator('button:has(svg path[d*="M8.293"])')
-                if next_btn.count() > 0 and next_btn.first.is_enabled():
-                    print("➡️ Clicking Next button to scroll carousel.")
-                    next_btn.first.click()
-                    self.page.wait_for_timeout(500)
-                else:
-                    print("🚫 Next button not available or disabled.")
-                    break
-
-        print("❌ No fallback clickable link found.")
-        return False
-    
     def channel_exists(self, channel_slug: str) -> bool:
         locator = self.page.locator(f'a[href*="/player/channel-linear/{channel_slug}/"]')
         return locator.count() > 0
@@ -140,7 +210,59 @@ class ForYouPage:
     def get_channel_href(self, channel_slug: str) -> str:
         locator = self.page.locator(f'a[href*="/player/channel-linear/{channel_slug}/"]').first
         return locator.get_attribute("href")
-    
+
+    def get_channel_hrefs(self) -> dict:
+        """Returns {slug: href} for every channel link rendered or listed in a content payload."""
+        self.content.refresh()
+        return {**self.content.hrefs(), **self._channel_map(self.page.evaluate(self.CHANNEL_HREFS_JS))}
+
+    CHANNEL_HREFS_JS = """() => Array.from(
+        document.querySelectorAll('a[href*="/player/channel-linear/"]'),
+        a => a.getAttribute('href'))"""
+
+    @staticmethod
+    def _channel_map(hrefs: list) -> dict:
+        channels = {}
+        for href in hrefs:
+            match = re.match(r"/player/channel-linear/([^/]+)/[a-f0-9-]+", href or "")
+            if match:
+                channels.setdefault(match.group(1), match.group(0))
+        return channels
+
+    def goto_channel(self, href: str, timeout: int = 5000) -> bool:
+        """Navigates straight to a channel href and confirms the player rendered for it."""
+        with vitals.navigation(self.page, "channel"):
+            self.page.goto(urljoin(self.base_url, href))
+        return self._channel_loaded(href, timeout)
+
+    def _channel_loaded(self, href: str, timeout: int = 5000) -> bool:
+        try:
+            self.page.locator('button[aria-label^="Play"]:visible').first.wait_for(state="visible", timeout=timeout)
+        except Exception as e:
+            print(f"⚠️ Channel page did not load from {href}: {e}")
+            return False
+        return href.rstrip("/") in self.page.url
+
+    def start_playback_metrics(self):
+        """Hook media element and MediaSource events on this page and every page it loads later."""
+        self.page.add_init_script(PLAYBACK_METRICS_JS)
+        self.page.evaluate(PLAYBACK_METRICS_JS)
+
+    def get_playback_metrics(self, wait_for_audio: int = 0) -> dict:
+        """
+        Time to first audio, stall count/duration and segment sizes since start_playback_metrics().
+        wait_for_audio (ms) first waits for audio to actually start.
+        """
+        if wait_for_audio:
+            try:
+                self.page.wait_for_function(FIRST_AUDIO_JS, timeout=wait_for_audio)
+            except Exception:
+                print(f"⚠️ Audio did not start within {wait_for_audio} ms")
+        metrics = summarize(self.page.evaluate(COLLECT_JS))
+        print(f"🎧 Playback: first audio {metrics['time_to_first_audio_ms']} ms, {metrics['stalls']} stall(s), "
+              f"{metrics['segments']} segment(s) / {metrics['segment_bytes'] / 1024:.0f} KB")
+        return metrics
+
     def force_dismiss_playback_stalled_modal(self) -> bool:
         try:
             modal = self.page.locator('[data-qa="content-overlay-modal"]')
@@ -1,32 +1,38 @@
 from playwright.sync_api import Page
+from pages import BASE_URL
+from pages.locators import LOCATORS
+from utils.selector_registry import selector_registry
+from utils.web_vitals import vitals
 
 # This class models the SiriusXM homepage using Page Object Model (POM)
 class HomePage:
-    def __init__(self, page):
+    def __init__(self, page, base_url: str = BASE_URL):
         self.page = page
-        self.global_nav = "nav[data-componenttype='Global Nav']"
-        self.start_listening_button = "a:has(div.rl2_button-module_content_4PKD6:has-text('Start Listening'))"
-        self.discover_button = "button[aria-label='Discover']"
+        self.base_url = base_url
+        # Primary selectors; the registry falls back to the rest of each LOCATORS chain
+        self.global_nav = LOCATORS["home.global_nav"][0]
+        self.start_listening_button = LOCATORS["home.start_listening"][0]
+        self.discover_button = LOCATORS["home.discover_button"][0]
         self.discover_dropdown = "a.has(div.rl2_button-module_content_4PKD6:has-test('Browse all content'))"
 
     def goto(self):
-        self.page.goto("https://www.siriusxm.com/")
+        with vitals.navigation(self.page, "home"):
+            self.page.goto(f"{self.base_url}/")
 
     def is_nav_visible(self):
-        self.page.wait_for_selector(self.global_nav, timeout=10000)
-        return self.page.is_visible(self.global_nav)
+        return selector_registry.resolve(self.page, "home.global_nav", timeout=10000).is_visible()
 
     def click_start_listening(self):
-        self.page.wait_for_selector(self.start_listening_button, timeout=10000)
-        self.page.click(self.start_listening_button)
+        selector_registry.resolve(self.page, "home.start_listening", timeout=10000).click()
 
     def click_discover_button(self):
         # Click the Discover button
-        self.page.get_by_role("button", name="Discover").click()
-        
+        discover = selector_registry.resolve(self.page, "home.discover_button", timeout=7000)
+        discover.click()
+
         # Wait for aria-expanded to become true (dropdown opened)
-        self.page.wait_for_selector("button[aria-label='Discover'][aria-expanded='true']", timeout=7000)
-        
+        discover.and_(self.page.locator("[aria-expanded='true']")).wait_for(state="visible", timeout=7000)
+
         return True  # Optional: You could also return a boolean
 
 
@@ -0,0 +1,28 @@
+# Central registry of logical elements -> ranked fallback selectors.
+# The first entry is the selector the page objects have always used; later entries are
+# sturdier fallbacks for when hashed class names or icon paths drift.
+LOCATORS = {
+    "home.global_nav": [
+        "nav[data-componenttype='Global Nav']",
+        "header nav",
+    ],
+    "home.start_listening": [
+        "a:has(div.rl2_button-module_content_4PKD6:has-text('Start Listening'))",
+        "a:has([class*='button-module_content']:has-text('Start Listening'))",
+        "a:has-text('Start Listening')",
+    ],
+    "home.discover_button": [
+        "button[aria-label='Discover']",
+        "role=button[name='Discover']",
+    ],
+    "login.cookie_accept": [
+        "button#onetrust-accept-btn-handler",
+        "button:has-text('Accept All Cookies')",
+    ],
+    # Used inside document.querySelector, so plain CSS only
+    "for_you.next_button": [
+        'button:has(svg path[d*="M8.293"])',
+        'button[aria-label*="next" i]',
+        'button[data-qa*="next" i]',
+    ],
+}
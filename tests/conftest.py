@@ -0,0 +1,306 @@
+import asyncio
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from playwright.sync_api import Error as PlaywrightError, sync_playwright
+from pages.async_for_you_page import AsyncForYouPage
+from pages.async_home_page import AsyncHomePage
+from pages.async_login_page import AsyncLoginPage
+from pages.for_you_page import ForYouPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from utils.artifacts import artifacts
+from utils import browser_server
+from utils.auth_cache import AuthStateCache, HOME_URL
+from utils.browser_pool import BrowserPool
+from utils.channel_index import ChannelIndex
+from utils.content_index import track_content
+from utils.instrumentation import profiler
+from utils.har import HAR_MODES, attach_har, har_path
+from utils.network_policy import build_policies, clear_policy
+from utils.selector_registry import selector_registry
+from utils.step_runner import step_reports
+from utils.trace_window import trace_window
+from utils.visual import visual_baselines
+from utils.waits import track_network, wait_stats, watch_dom
+from utils.watchdog import watchdog
+from utils.web_vitals import vitals
+
+if os.getenv("CI") != "true":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# One set per session so the blocked-request counters cover the whole run
+network_policies = build_policies()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser pool")
+    group.addoption("--headed", action="store_true", default=os.getenv("HEADED") == "true",
+                    help="Run Chromium with a visible window")
+    group.addoption("--browser-server", action="store_true", default=os.getenv("PW_BROWSER_SERVER") == "true",
+                    help="Attach to the long-lived browser daemon (utils.browser_server), starting it if needed")
+    group.addoption("--skip-missing-browser", action="store_true",
+                    default=os.getenv("PW_SKIP_MISSING_BROWSER") == "true",
+                    help="Local runs only: skip browser tests instead of failing when Chromium is not installed")
+    group.addoption("--pool-size", type=int, default=int(os.getenv("PW_POOL_SIZE", "2")),
+                    help="Maximum number of browser contexts kept open per worker")
+    group.addoption("--context-max-uses", type=int, default=int(os.getenv("PW_CONTEXT_MAX_USES", "10")),
+                    help="Recycle a browser context after it has served this many tests")
+    group.addoption("--network-policy", default=os.getenv("PW_NETWORK_POLICY", "minimal"),
+                    choices=sorted(network_policies),
+                    help="Request blocking policy applied to every context (override per test with "
+                         "@pytest.mark.network_policy)")
+
+    har = parser.getgroup("har record/replay")
+    har.addoption("--har-mode", default=os.getenv("PW_HAR_MODE", "off"), choices=HAR_MODES,
+                  help="record: save each test's traffic to a HAR archive; replay: serve it offline")
+    har.addoption("--har-dir", default=os.getenv("PW_HAR_DIR", os.path.join(os.getcwd(), "hars")),
+                  help="Directory holding one HAR archive per test")
+    har.addoption("--har-not-found", default=os.getenv("PW_HAR_NOT_FOUND", "strict"), choices=("strict", "lenient"),
+                  help="On replay, strict aborts requests missing from the archive; lenient sends them to the network")
+
+    parser.addoption("--profile", default=os.getenv("PW_PROFILE"), metavar="TRACE_JSON",
+                     help="Time every page-object method and test step and write Chrome trace events here")
+    parser.addoption("--trace-window", type=int, default=int(os.getenv("PW_TRACE_WINDOW", "0")), metavar="N",
+                     help="Trace every test in chunks and keep the last N page-object calls/steps; "
+                          "written to traces/ only when the test fails")
+    parser.addoption("--vitals", action="store_true", default=os.getenv("PW_VITALS") == "true",
+                     help="Record navigation timing and Web Vitals for every page-object navigation "
+                          "(report with `python -m utils.web_vitals report`)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network_policy(name): run the test with a named request blocking policy")
+    if config.getoption("profile"):
+        profiler.enable(HomePage, LoginPage, ForYouPage, AsyncHomePage, AsyncLoginPage, AsyncForYouPage)
+    if config.getoption("trace_window"):
+        trace_window.enable(HomePage, LoginPage, ForYouPage, AsyncHomePage, AsyncLoginPage, AsyncForYouPage,
+                            size=config.getoption("trace_window"))
+    if config.getoption("vitals"):
+        vitals.enable()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Fixtures read item.rep_call to decide whether a failure trace is worth keeping
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(autouse=True)
+def _profile_test(request):
+    with profiler.step(request.node.nodeid):
+        yield
+
+
+@pytest.fixture
+def run_async():
+    """asyncio.run() on a worker thread: once sync Playwright has started, the main thread has a running loop."""
+    def run(coro):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    return run
+
+
+@pytest.fixture(scope="session")
+def playwright_instance():
+    with sync_playwright() as p:
+        yield p
+
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance, pytestconfig):
+    """One Chromium per session (per worker when running under xdist)."""
+    if pytestconfig.getoption("browser_server"):
+        # Closing a CDP-attached browser only disconnects; the daemon keeps Chromium warm
+        browser = browser_server.attach(playwright_instance, headless=not pytestconfig.getoption("headed"))
+    else:
+        try:
+            browser = playwright_instance.chromium.launch(headless=not pytestconfig.getoption("headed"))
+        except PlaywrightError as e:
+            # Off by default, so a CI job whose `playwright install` failed still fails loudly
+            if not pytestconfig.getoption("skip_missing_browser") or "Executable doesn't exist" not in str(e):
+                raise
+            pytest.skip("Playwright browsers are not installed (run `playwright install chromium`)")
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(browser, pytestconfig):
+    pool = BrowserPool(
+        browser,
+        size=pytestconfig.getoption("pool_size"),
+        max_uses=pytestconfig.getoption("context_max_uses"),
+    )
+    # Installed on every checkout and removed on release, so reused contexts (including the
+    # ones AuthStateCache borrows) never carry the previous test's handlers or routes.
+    # Cookie banner, playback-stalled and overlay handlers fire only when they block an action
+    pool.add_context_hook(watchdog.install, watchdog.uninstall)
+    pool.add_context_hook(teardown=clear_policy)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def network_policy(request, pytestconfig):
+    """The policy for this test: its network_policy marker, else --network-policy."""
+    marker = request.node.get_closest_marker("network_policy")
+    name = marker.args[0] if marker else pytestconfig.getoption("network_policy")
+    return network_policies[name]
+
+
+def _open_context(request, browser_pool, network_policy, **context_options):
+    """Acquire a pooled context with the HAR mode and network policy for this test applied."""
+    config = request.config
+    mode = config.getoption("har_mode")
+    # HAR archives are only written when the context closes, so those contexts are never shared
+    context = browser_pool.acquire(dedicated=mode != "off", **context_options)
+    try:
+        attach_har(context, har_path(config.getoption("har_dir"), request.node.nodeid), mode,
+                   strict=config.getoption("har_not_found") == "strict")
+    except FileNotFoundError as e:
+        browser_pool.release(context)
+        pytest.skip(str(e))
+    network_policy.apply(context)
+    trace_window.start(context, request.node.name)
+    return context
+
+
+def _close_context(request, browser_pool, context):
+    """Keep the trace window if the test failed, then hand the context back to the pool."""
+    report = getattr(request.node, "rep_call", None)
+    saved = trace_window.finish(context, failed=report is None or report.failed, name=request.node.nodeid)
+    if saved:
+        print(f"\n🧵 Trace of the last {len(saved)} step(s) saved; open with `playwright show-trace {saved[-1]}`")
+    browser_pool.release(context)
+
+
+@pytest.fixture
+def context(request, browser_pool, network_policy):
+    """A clean BrowserContext from the pool, returned to it after the test."""
+    context = _open_context(request, browser_pool, network_policy)
+    yield context
+    _close_context(request, browser_pool, context)
+
+
+@pytest.fixture
+def page(context):
+    """A fresh Page in a pooled context, ready to hand to the page objects."""
+    page = context.new_page()
+    track_network(page)
+    watch_dom(page)
+    watchdog.attach(page)
+    return page
+
+
+@pytest.fixture(scope="session")
+def auth_cache():
+    return AuthStateCache()
+
+
+@pytest.fixture(scope="session")
+def auth_state(auth_cache, browser_pool, pytestconfig):
+    """Path to a logged-in storage_state, produced by at most one UI login per session."""
+    username, password = os.getenv("SIRIUSXM_USERNAME"), os.getenv("SIRIUSXM_PASSWORD")
+    if pytestconfig.getoption("har_mode") == "replay":
+        # Offline: the archive already holds logged-in responses, so no login or probe
+        path = auth_cache.state_path(username) if username else None
+        return path if path and os.path.exists(path) else None
+    assert username and password, "Missing credentials in environment variables"
+    return auth_cache.get_state(browser_pool, username, password)
+
+
+@pytest.fixture(scope="session")
+def channel_index():
+    """On-disk slug -> href index so known channels are opened by direct navigation."""
+    return ChannelIndex()
+
+
+@pytest.fixture
+def authenticated_page(request, browser_pool, auth_state, network_policy):
+    """A Page already signed in and sitting on /player/home."""
+    context = _open_context(request, browser_pool, network_policy, storage_state=auth_state)
+    page = context.new_page()
+    track_network(page)
+    watch_dom(page)
+    track_content(page)
+    watchdog.attach(page)
+    page.goto(HOME_URL)
+    yield page
+    _close_context(request, browser_pool, context)
+
+
+def pytest_sessionfinish(session):
+    # Screenshots are written in the background; make sure they are on disk before exit
+    artifacts.flush()
+    selector_registry.save()
+    if vitals.enabled:
+        count = len(vitals.samples)
+        vitals.save()
+        print(f"\n📈 {count} navigation sample(s) saved to {vitals.path} (run {vitals.run_id}, commit {vitals.commit})")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    trace_path = config.getoption("profile")
+    if trace_path and profiler.events:
+        profiler.write_chrome_trace(trace_path)
+        terminalreporter.section("page-object profile")
+        terminalreporter.write_line(
+            f"{'step':<52}{'calls':>6}{'total ms':>10}{'IPC':>6}{'wait ms':>9}{'act ms':>9}{'KB':>8}{'errors':>7}")
+        for row in profiler.summary():
+            terminalreporter.write_line(
+                f"{row['step'][-52:]:<52}{row['calls']:>6}{row['total_ms']:>10.0f}{row['round_trips']:>6}"
+                f"{row['wait_ms']:>9.0f}{row['act_ms']:>9.0f}{row['bytes'] / 1024:>8.0f}{row['errors']:>7}")
+        terminalreporter.write_line(f"Chrome trace written to: {trace_path}")
+
+    used = [p.stats() for p in network_policies.values() if p.requests or p.allowed_bytes]
+    if used:
+        terminalreporter.section("network policies")
+        for stats in used:
+            terminalreporter.write_line(
+                f"{stats['policy']:<10} requests={stats['requests']} blocked={stats['blocked']} "
+                f"allowed_kb={stats['allowed_bytes'] / 1024:.0f} by_type={stats['blocked_by_type']}")
+
+    if trace_window.marks:
+        stats = trace_window.stats()
+        terminalreporter.section("trace window")
+        terminalreporter.write_line(f"chunks cut={stats['marks']} avg_ms={stats['avg_ms']:.1f} "
+                                    f"max_ms={stats['max_ms']:.1f} total_ms={stats['total_ms']:.0f}")
+
+    retried = [r for r in step_reports if r["attempts"] > 1]
+    if retried:
+        terminalreporter.section("step retries")
+        for r in retried:
+            terminalreporter.write_line(
+                f"{r['test']} :: {r['step']}: {r['attempts']} attempts, retries cost {r['retry_cost_ms']:.0f} ms "
+                f"({'passed' if r['ok'] else 'failed'})")
+
+    drifted = [r for r in selector_registry.summary() if r["misses"]]
+    if drifted:
+        terminalreporter.section("selector fallbacks")
+        for r in drifted:
+            terminalreporter.write_line(
+                f"{r['name']}: {r['selector']} hits={r['hits']} misses={r['misses']} avg_ms={r['avg_ms']:.0f}")
+
+    fired = [r for r in watchdog.summary() if r["fires"]]
+    if fired:
+        terminalreporter.section("overlay handlers")
+        for r in fired:
+            terminalreporter.write_line(
+                f"{r['name']}: fired={r['fires']} errors={r['errors']} avg_ms={r['avg_ms']:.0f} max_ms={r['max_ms']:.0f}")
+
+    if any(visual_baselines.stats.values()):
+        terminalreporter.section("visual checks")
+        terminalreporter.write_line(" ".join(f"{k}={v}" for k, v in visual_baselines.stats.items()))
+
+    rows = wait_stats.summary()
+    if not rows:
+        return
+    terminalreporter.section("settle waits")
+    terminalreporter.write_line(f"{'wait':<28}{'count':>7}{'total ms':>11}{'max ms':>9}{'timeouts':>10}")
+    for row in rows:
+        terminalreporter.write_line(
+            f"{row['label']:<28}{row['count']:>7}{row['total_ms']:>11.0f}{row['max_ms']:>9.0f}{row['timeouts']:>10}")
@@ -0,0 +1,39 @@
+import os
+from utils.artifacts import ArtifactWriter
+
+
+def test_writer_drops_duplicate_frames(tmp_path):
+    writer = ArtifactWriter(root=str(tmp_path), max_bytes=10_000)
+    first = writer.submit(b"frame-a", "after_nav_click")
+    writer.submit(b"frame-a", "after_nav_click")
+    writer.flush()
+
+    assert os.listdir(tmp_path) == [os.path.basename(first)]
+    assert writer.written == 1 and writer.duplicates == 1
+
+
+def test_repeated_frame_under_another_name_still_exists_at_its_path(tmp_path):
+    writer = ArtifactWriter(root=str(tmp_path), max_bytes=10_000)
+    first = writer.submit(b"frame-a", "username_input_failure")
+    second = writer.submit(b"frame-a", "for_you_test_failure")
+    writer.flush()
+
+    assert first != second
+    assert open(second, "rb").read() == b"frame-a"
+    assert writer.written == 1
+
+
+def test_writer_evicts_oldest_artifacts_over_budget(tmp_path):
+    (tmp_path / "baseline.png").write_bytes(b"x" * 100)  # not ours, never evicted
+    writer = ArtifactWriter(root=str(tmp_path), max_bytes=250)
+    paths = []
+    for i in range(4):
+        paths.append(writer.submit(bytes([i]) * 100, f"shot_{i}"))
+        writer.flush()
+        os.utime(paths[-1], (i, i))
+
+    remaining = sorted(os.listdir(tmp_path))
+    assert "baseline.png" in remaining
+    assert os.path.basename(paths[0]) not in remaining
+    assert os.path.basename(paths[-1]) in remaining
+    assert writer.evicted >= 1
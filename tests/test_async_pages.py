@@ -0,0 +1,32 @@
+import inspect
+import pytest
+from pages.async_for_you_page import AsyncForYouPage
+from pages.async_home_page import AsyncHomePage
+from pages.async_login_page import AsyncLoginPage
+from pages.for_you_page import ForYouPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from utils.flow_runner import summarize
+
+
+@pytest.mark.parametrize("sync_cls, async_cls", [
+    (HomePage, AsyncHomePage),
+    (LoginPage, AsyncLoginPage),
+    (ForYouPage, AsyncForYouPage),
+])
+def test_async_page_objects_mirror_sync_methods(sync_cls, async_cls):
+    for name, member in inspect.getmembers(sync_cls, inspect.isfunction):
+        if name.startswith("__") or isinstance(inspect.getattr_static(sync_cls, name), staticmethod):
+            continue
+        assert inspect.iscoroutinefunction(getattr(async_cls, name)), f"{async_cls.__name__}.{name} is not async"
+
+
+def test_summarize_groups_results_by_flow():
+    results = [
+        {"flow": "home", "ok": True, "ms": 100.0, "error": None},
+        {"flow": "home", "ok": False, "ms": 50.0, "error": "boom"},
+        {"flow": "for-you", "ok": True, "ms": 300.0, "error": None},
+    ]
+    rows = summarize(results, wall_ms=1000)
+    assert rows[0] == {"flow": "home", "runs": 2, "ok": 1, "median_ms": 100.0}
+    assert rows[-1]["flows_per_sec"] == 3.0
@@ -0,0 +1,96 @@
+import json
+import time
+from utils import auth_cache
+from utils.auth_cache import AuthStateCache
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+
+    def goto(self, url):
+        # A valid session stays on /player/home; anything else bounces to the login page
+        self.url = url if self.context.logged_in else url.replace("/player/home", "/player/login")
+
+    def wait_for_url(self, pattern, timeout=None):
+        if "/player/home" not in self.url:
+            raise TimeoutError("still on the login page")
+
+    def wait_for_selector(self, selector, timeout=None):
+        pass
+
+
+class FakeContext:
+    def __init__(self, logged_in):
+        self.logged_in = logged_in
+
+    def new_page(self):
+        return FakePage(self)
+
+    def storage_state(self, path):
+        with open(path, "w") as f:
+            json.dump({"cookies": [{"name": "session", "expires": time.time() + 3600}]}, f)
+
+
+class FakePool:
+    def __init__(self, session_valid=True):
+        self.session_valid = session_valid
+        self.acquired = []
+        self.released = 0
+
+    def acquire(self, storage_state=None):
+        self.acquired.append(storage_state)
+        return FakeContext(logged_in=storage_state is not None and self.session_valid)
+
+    def release(self, context):
+        self.released += 1
+
+
+class FakeLoginPage:
+    def __init__(self, page):
+        self.page = page
+        self.last_login = None
+
+    def login(self, username, password):
+        self.page.context.logged_in = True
+        self.last_login = {"path": "ui", "ms": 1.0}
+
+
+def _cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth_cache, "LoginPage", FakeLoginPage)
+    return AuthStateCache(cache_dir=str(tmp_path))
+
+
+def test_logs_in_once_then_reuses_the_cached_state(tmp_path, monkeypatch):
+    cache, pool = _cache(tmp_path, monkeypatch), FakePool()
+    path = cache.get_state(pool, "User@Example.com", "secret")
+    assert (cache.logins, cache.reuses) == (1, 0)
+    assert cache.last_login["path"] == "ui"
+    assert "example" not in path.lower()
+
+    assert cache.get_state(pool, "user@example.com", "secret") == path
+    assert (cache.logins, cache.reuses) == (1, 1)
+    assert pool.acquired == [None, path] and pool.released == 2
+
+
+def test_refreshes_when_the_probe_fails(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch)
+    cache.get_state(FakePool(), "user@example.com", "secret")
+
+    pool = FakePool(session_valid=False)
+    path = cache.get_state(pool, "user@example.com", "secret")
+    assert pool.acquired == [path, None]
+    assert (cache.logins, cache.reuses) == (2, 0)
+
+
+def test_expired_cookies_skip_the_probe(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch)
+    path = cache.state_path("user@example.com")
+    with open(path, "w") as f:
+        json.dump({"cookies": [{"name": "session", "expires": time.time() - 60}]}, f)
+
+    pool = FakePool()
+    cache.get_state(pool, "user@example.com", "secret")
+    assert pool.acquired == [None]
+    assert cache.logins == 1
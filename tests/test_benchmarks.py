@@ -0,0 +1,26 @@
+import urllib.error
+import urllib.request
+import pytest
+from benchmarks.fixture_site import FixtureSite, TARGET_SLUG
+from benchmarks.run import compare, parse_sizes
+
+
+def test_fixture_site_serves_page_object_selectors():
+    with FixtureSite(carousels=2, links_per_carousel=4, pages_per_carousel=2) as site:
+        home = urllib.request.urlopen(f"{site.base_url}/player/home").read().decode()
+        login = urllib.request.urlopen(f"{site.base_url}/player/login").read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{site.base_url}/nope")
+
+    assert 'data-qa="content-nav-for-you"' in home
+    assert f"/player/channel-linear/{TARGET_SLUG}/" in home
+    assert "data-qa=\"email-field\"" in login
+    assert site.requests == 3
+
+
+def test_compare_flags_time_and_round_trip_regressions():
+    baseline = {"case@1x1x1": {"median_ms": 100.0, "round_trips": 10}}
+    assert compare({"case@1x1x1": {"median_ms": 120.0, "round_trips": 10}}, baseline, 0.25, 0.0) == []
+    regressions = compare({"case@1x1x1": {"median_ms": 130.0, "round_trips": 11}}, baseline, 0.25, 0.0)
+    assert len(regressions) == 2
+    assert parse_sizes("3x10x1, 5x20x2") == [(3, 10, 1), (5, 20, 2)]
@@ -0,0 +1,67 @@
+import pytest
+from utils.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        self.routes = 0
+
+    def unroute_all(self, behavior=None):
+        self.routes = 0
+
+    def clear_cookies(self):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def test_pool_reuses_and_recycles_contexts():
+    browser = FakeBrowser()
+    pool = BrowserPool(browser, size=1, max_uses=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first  # reused while under max_uses
+    pool.release(first)
+    assert first.closed  # recycled after the second use
+
+    second = pool.acquire()
+    assert second is not first
+    assert len(browser.contexts) == 2
+
+
+def test_pool_refuses_when_exhausted():
+    pool = BrowserPool(FakeBrowser(), size=1)
+    pool.acquire()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_context_hooks_run_per_checkout_and_reset_routes():
+    events = []
+    pool = BrowserPool(FakeBrowser(), size=1, max_uses=5)
+    pool.add_context_hook(lambda c: events.append("setup"), lambda c: events.append("teardown"))
+    pool.add_context_hook(teardown=lambda c: events.append("clear policy"))
+
+    context = pool.acquire()
+    context.routes = 2
+    pool.release(context)
+    assert context.routes == 0
+    assert pool.acquire() is context
+    assert events == ["setup", "teardown", "clear policy", "setup"]
@@ -0,0 +1,72 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from utils import browser_server
+
+
+class _DevTools(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"Browser": "HeadlessChrome/0.0"} if self.path == "/json/version" else []).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_status_and_health_follow_the_state_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(browser_server, "STATE_FILE", str(tmp_path / "state.json"))
+    assert browser_server.read_state() is None
+    assert browser_server.main(["status"]) == 1
+
+    server = HTTPServer(("127.0.0.1", 0), _DevTools)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        state = {"pid": 0, "endpoint": f"http://127.0.0.1:{server.server_port}",
+                 "executable": "chrome", "playwright_version": browser_server.PLAYWRIGHT_VERSION}
+        (tmp_path / "state.json").write_text(json.dumps(state))
+        assert browser_server.is_healthy(browser_server.read_state())
+        assert browser_server.main(["status"]) == 0
+    finally:
+        server.shutdown()
+
+    assert not browser_server.is_healthy(state, timeout=0.5)
+
+
+# Exits 0.5 s after SIGTERM, like a daemon caught mid health-check sleep
+_SLOW_DAEMON = """
+import os, signal, sys, time
+def bye(*_):
+    time.sleep(0.5)
+    os.remove(sys.argv[1])
+    sys.exit(0)
+signal.signal(signal.SIGTERM, bye)
+open(sys.argv[1] + ".ready", "w").close()
+while True:
+    time.sleep(0.1)
+"""
+
+
+def test_stop_returns_only_after_the_daemon_exited(tmp_path, monkeypatch):
+    state_file = tmp_path / "state.json"
+    monkeypatch.setattr(browser_server, "STATE_FILE", str(state_file))
+    daemon = subprocess.Popen([sys.executable, "-c", _SLOW_DAEMON, str(state_file)])
+    state_file.write_text(json.dumps({"pid": daemon.pid, "endpoint": "http://127.0.0.1:9"}))
+    while not (tmp_path / "state.json.ready").exists():
+        time.sleep(0.02)
+
+    browser_server.stop()
+    assert daemon.poll() is not None
+    assert browser_server.read_state() is None
+
+
+def test_no_sandbox_can_be_forced_either_way(monkeypatch):
+    monkeypatch.setenv("PW_NO_SANDBOX", "false")
+    assert not browser_server._needs_no_sandbox()
+    monkeypatch.setenv("PW_NO_SANDBOX", "true")
+    assert browser_server._needs_no_sandbox()
@@ -0,0 +1,16 @@
+from utils.channel_index import ChannelIndex
+
+
+def test_channel_index_persists_and_expires(tmp_path):
+    path = str(tmp_path / "channel_index.json")
+    index = ChannelIndex(path=path, ttl=60)
+    index.record("siriusxm-hits-1", "/player/channel-linear/siriusxm-hits-1/abc-123")
+
+    reloaded = ChannelIndex(path=path, ttl=60)
+    assert reloaded.get("siriusxm-hits-1") == "/player/channel-linear/siriusxm-hits-1/abc-123"
+    assert reloaded.get("pop2K") is None
+
+    assert ChannelIndex(path=path, ttl=-1).get("siriusxm-hits-1") is None
+
+    reloaded.invalidate("siriusxm-hits-1")
+    assert ChannelIndex(path=path, ttl=60).get("siriusxm-hits-1") is None
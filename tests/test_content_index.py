@@ -0,0 +1,71 @@
+from utils.content_index import ContentIndex
+
+HITS = "/player/channel-linear/siriusxm-hits-1/0f3e5c2a-1b2c-4d5e-8f90-a1b2c3d4e5f6"
+
+
+def test_index_reads_hrefs_and_channel_entities_with_positions():
+    payload = {"page": {"containers": [
+        {"title": "Recommended", "items": [
+            {"name": "Pop2K", "entityType": "channel-linear", "urlSlug": "pop2K",
+             "channelId": "11111111-2222-3333-4444-555555555555", "images": [{"url": "x.jpg"}]},
+            {"title": "SiriusXM Hits 1", "deeplink": f"https://www.siriusxm.com{HITS}?src=foryou"},
+        ]},
+        {"title": "Podcasts", "items": [{"title": "A show", "type": "episode", "slug": "a-show",
+                                          "id": "99999999-2222-3333-4444-555555555555"}]},
+    ]}}
+    index = ContentIndex()
+    index.ingest(payload)
+
+    assert index.get("siriusxm-hits-1") == {"href": HITS, "title": "SiriusXM Hits 1",
+                                            "carousel": "Recommended", "position": 1, "built": False}
+    assert index.get("pop2K")["href"] == "/player/channel-linear/pop2K/11111111-2222-3333-4444-555555555555"
+    assert index.get("pop2K")["position"] == 0 and index.get("pop2K")["built"]
+    assert index.get("a-show") is None
+    # Built hrefs are not handed out until a page load confirms them
+    assert set(index.hrefs()) == {"siriusxm-hits-1"}
+    index.confirm("pop2K")
+    assert set(index.hrefs()) == {"siriusxm-hits-1", "pop2K"}
+
+
+def test_payload_href_replaces_built_one_and_dropped_hrefs_stay_dropped():
+    channel = {"entityType": "channel-linear", "urlSlug": "siriusxm-hits-1",
+               "channelId": "11111111-2222-3333-4444-555555555555"}
+    index = ContentIndex()
+    index.ingest([channel])
+    assert index.get("siriusxm-hits-1")["built"]
+
+    index.drop("siriusxm-hits-1")
+    index.ingest([channel])
+    assert index.get("siriusxm-hits-1") is None
+
+    index.ingest([channel, {"title": "SiriusXM Hits 1", "href": HITS}])
+    assert index.get("siriusxm-hits-1")["href"] == HITS and not index.get("siriusxm-hits-1")["built"]
+
+
+class FakeResponse:
+    ok = True
+    headers = {"content-type": "application/json"}
+
+    def __init__(self, n):
+        self.n = n
+        self.request = type("Request", (), {"resource_type": "fetch"})()
+
+    def json(self):
+        return {"title": f"Shelf {self.n}", "items": [{"href": HITS}]}
+
+
+class FakePage:
+    def on(self, event, callback):
+        self.on_response = callback
+
+
+def test_pending_responses_are_capped_to_the_newest():
+    page = FakePage()
+    index = ContentIndex(page, max_pending=3)
+    for n in range(5):
+        page.on_response(FakeResponse(n))
+    assert [r.n for r in index.pending] == [2, 3, 4] and index.dropped == 2
+
+    index.refresh()
+    assert index.parsed == 3 and not index.pending
+    assert index.get("siriusxm-hits-1")["carousel"] == "Shelf 2"
@@ -0,0 +1,54 @@
+from benchmarks.fixture_site import FixtureSite, TARGET_SLUG
+from pages.for_you_page import ForYouPage
+from pages.login_page import LoginPage
+from utils.watchdog import watchdog
+
+
+def _open_for_you(page, site) -> ForYouPage:
+    page.goto(f"{site.base_url}/player/home")
+    for_you_page = ForYouPage(page, base_url=site.base_url)
+    for_you_page.click_for_you_nav()
+    return for_you_page
+
+
+def test_scan_pages_to_target_on_last_page(page):
+    with FixtureSite(carousels=3, links_per_carousel=6, pages_per_carousel=3) as site:
+        for_you_page = _open_for_you(page, site)
+        assert not for_you_page.channel_exists(TARGET_SLUG)
+
+        assert for_you_page.click_channel_by_href(TARGET_SLUG)
+        page.wait_for_url(f"**/player/channel-linear/{TARGET_SLUG}/**", timeout=5000)
+
+
+def test_scan_keeps_slug_priority_across_pages(page):
+    with FixtureSite(carousels=3, links_per_carousel=6, pages_per_carousel=3) as site:
+        for_you_page = _open_for_you(page, site)
+        # channel-0-0 is on screen at once, but channel-1-4 (third page) ranks higher
+        slugs = ["not-in-any-carousel", "channel-1-4", "channel-0-0"]
+
+        assert for_you_page.click_first_matching_channel(slugs) == "channel-1-4"
+        page.wait_for_url("**/player/channel-linear/channel-1-4/**", timeout=5000)
+
+
+def test_scan_stops_when_next_is_disabled(page, capsys):
+    with FixtureSite(carousels=2, links_per_carousel=3, pages_per_carousel=1) as site:
+        for_you_page = _open_for_you(page, site)
+        capsys.readouterr()
+
+        assert for_you_page.click_first_matching_channel(["not-in-any-carousel"]) is None
+        output = capsys.readouterr().out
+        assert "Scan 1: 2 carousels, 6 potential link(s)" in output
+        assert "Scan 2" not in output
+        assert "/player/home/for-you" in page.url
+
+
+def test_watchdog_accepts_cookie_banner_during_username_submit(page):
+    with FixtureSite(cookie_banner=True) as site:
+        login_page = LoginPage(page, base_url=site.base_url)
+        login_page.goto()
+        assert watchdog.watching(page)
+        accepted = watchdog.fires("cookie banner")
+
+        login_page.submit_username("listener@example.com")
+        assert page.locator(login_page.auth_method_container).is_visible()
+        assert watchdog.fires("cookie banner") == accepted + 1
@@ -1,5 +1,4 @@
 import os
-from playwright.sync_api import sync_playwright  # Sync API for Playwright
 from pages.home_page import HomePage            # Import the HomePage object
 
 if os.getenv("CI") != "true":
@@ -7,20 +6,16 @@ if os.getenv("CI") != "true":
     load_dotenv()
 
 # Test function using pytest naming convention (must start with 'test_')
-def test_homepage_nav_and_start_listening():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)  # optional: see what's happening
-        page = browser.new_page()
-        homepage = HomePage(page)
-        homepage.goto()
+# The page fixture comes from a pooled browser context (see tests/conftest.py)
+def test_homepage_nav_and_start_listening(page):
+    homepage = HomePage(page)
+    homepage.goto()
 
-        assert homepage.is_nav_visible()
+    assert homepage.is_nav_visible()
 
-        assert homepage.click_discover_button()
+    assert homepage.click_discover_button()
 
-        homepage.click_start_listening()
+    homepage.click_start_listening()
 
-        # Validate the new URL or action after clicking "Start Listening"
-        assert "player" in page.url.lower() or "siriusxm" in page.url.lower()
-
-        browser.close()
+    # Validate the new URL or action after clicking "Start Listening"
+    assert "player" in page.url.lower() or "siriusxm" in page.url.lower()
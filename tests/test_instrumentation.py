@@ -0,0 +1,51 @@
+import json
+import pytest
+from utils.instrumentation import Profiler
+
+
+class FakePageObject:
+    def __init__(self):
+        self.page = None
+
+    def click(self):
+        return "clicked"
+
+    async def load(self):
+        return "loaded"
+
+
+def test_profiler_wraps_methods_and_writes_chrome_trace(tmp_path, run_async):
+    profiler = Profiler()
+    profiler.enable(FakePageObject)
+    try:
+        po = FakePageObject()
+        with profiler.step("test step"):
+            assert po.click() == "clicked"
+            assert run_async(po.load()) == "loaded"
+    finally:
+        profiler.disable()
+
+    names = [e["name"] for e in profiler.events]
+    assert names == ["FakePageObject.click", "FakePageObject.load", "test step"]
+    assert FakePageObject.click.__qualname__ == "FakePageObject.click"
+
+    trace_path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(str(trace_path))
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert {e["ph"] for e in events} == {"X"}
+    assert profiler.summary()[0]["step"] == "test step"
+
+
+def test_disabled_profiler_step_is_a_no_op():
+    profiler = Profiler()
+    with profiler.step("ignored"):
+        pass
+    assert profiler.events == []
+
+
+def test_ipc_counting_fails_clearly_without_the_private_hook(monkeypatch):
+    from utils import ipc_counter
+    monkeypatch.setattr(ipc_counter, "_original_send", None)
+    with pytest.raises(RuntimeError, match="_send_message_to_server"):
+        with ipc_counter.count_ipc():
+            pass
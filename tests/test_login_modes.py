@@ -0,0 +1,124 @@
+import pytest
+from pages.login_page import LoginPage
+
+
+class FakeResponse:
+    def __init__(self, ok):
+        self.ok = ok
+        self.status = 200 if ok else 401
+        self.status_text = "OK" if ok else "Unauthorized"
+
+    def json(self):
+        return {}
+
+
+class FakeRequest:
+    def __init__(self, ok):
+        self.ok = ok
+        self.posts = []
+
+    def post(self, url, **kwargs):
+        self.posts.append(url)
+        return FakeResponse(self.ok)
+
+
+class FakeContext:
+    def __init__(self, api_ok):
+        self.request = FakeRequest(api_ok)
+
+
+class FakeLocator:
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = selectors
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state="visible", timeout=None):
+        pass
+
+    def is_visible(self):
+        return any(s in self.page.visible for s in self.selectors)
+
+
+class FakePage:
+    """Lands on /player/home with the For You nav only when the session is real."""
+
+    def __init__(self, api_ok, session_valid=True):
+        self.context = FakeContext(api_ok)
+        self.session_valid = session_valid
+        self.url = "about:blank"
+        self.visible = set()
+
+    def goto(self, url):
+        login = LoginPage(self)
+        if self.session_valid:
+            self.url, self.visible = url, {login.signed_in_nav}
+        else:
+            # The site keeps the URL but renders the login form in place
+            self.url, self.visible = url, {login.username_input}
+
+    def locator(self, selector):
+        return FakeLocator(self, [selector])
+
+
+def _login_page(page, auth_api_url="https://auth.example.com/password"):
+    login_page = LoginPage(page, base_url="https://example.com")
+    login_page.auth_api_url = auth_api_url
+    login_page.ui_logins = 0
+
+    def ui_login(username, password):
+        login_page.ui_logins += 1
+
+    login_page.ui_login = ui_login
+    return login_page
+
+
+def test_api_login_is_used_when_it_signs_in():
+    login_page = _login_page(FakePage(api_ok=True))
+    login_page.login("user@example.com", "secret", mode="auto")
+    assert login_page.last_login["path"] == "api"
+    assert login_page.ui_logins == 0
+
+
+@pytest.mark.parametrize("page", [FakePage(api_ok=False), FakePage(api_ok=True, session_valid=False)],
+                         ids=["rejected", "login form after redirect"])
+def test_auto_falls_back_to_ui_when_api_login_does_not_sign_in(page):
+    login_page = _login_page(page)
+    login_page.login("user@example.com", "secret", mode="auto")
+    assert login_page.last_login["path"] == "ui"
+    assert login_page.ui_logins == 1
+
+
+def test_api_mode_does_not_fall_back():
+    login_page = _login_page(FakePage(api_ok=False))
+    with pytest.raises(AssertionError):
+        login_page.login("user@example.com", "secret", mode="api")
+    assert login_page.ui_logins == 0
+
+
+def test_ui_mode_skips_the_api():
+    page = FakePage(api_ok=True)
+    login_page = _login_page(page)
+    login_page.login("user@example.com", "secret", mode="ui")
+    assert login_page.last_login["path"] == "ui"
+    assert page.context.request.posts == []
+
+
+def test_api_is_never_tried_without_a_configured_endpoint(monkeypatch):
+    monkeypatch.delenv("PW_LOGIN_MODE", raising=False)
+    monkeypatch.delenv("SIRIUSXM_AUTH_API_URL", raising=False)
+    page = FakePage(api_ok=True)
+    login_page = _login_page(page, auth_api_url=None)
+    assert LoginPage(page).login_mode == "ui" and LoginPage(page).auth_api_url is None
+
+    login_page.login("user@example.com", "secret", mode="auto")
+    assert login_page.last_login["path"] == "ui"
+    assert page.context.request.posts == []
+    with pytest.raises(AssertionError):
+        login_page.login("user@example.com", "secret", mode="api")
@@ -0,0 +1,20 @@
+from utils.network_policy import build_policies, NetworkPolicy
+
+
+def test_minimal_policy_blocks_heavy_assets_and_trackers():
+    minimal = build_policies()["minimal"]
+    assert minimal.should_block("image", "https://www.siriusxm.com/logo.png")
+    assert minimal.should_block("script", "https://www.googletagmanager.com/gtm.js")
+    assert minimal.should_block("script", "https://cdn.cookielaw.org/otSDKStub.js")
+    assert not minimal.should_block("script", "https://www.siriusxm.com/player/app.js")
+    assert not minimal.should_block("fetch", "https://api.edge-gateway.siriusxm.com/identity/v1/auth")
+
+
+def test_allow_hosts_override_blocks():
+    policy = NetworkPolicy("custom", block_types=["image"], allow_hosts=["*.siriusxm.com"])
+    assert not policy.should_block("image", "https://www.siriusxm.com/hero.jpg")
+    assert policy.should_block("image", "https://images.example.com/hero.jpg")
+
+
+def test_playback_policy_keeps_audio():
+    assert not build_policies()["playback"].should_block("media", "https://www.siriusxm.com/stream.aac")
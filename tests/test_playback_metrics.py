@@ -0,0 +1,26 @@
+from utils.playback_metrics import check_thresholds, summarize, thresholds_enabled
+
+
+def test_summary_and_thresholds():
+    raw = {
+        "playRequested": 1000.0, "firstAudio": 1850.0, "stalls": [400.0, 1200.0],
+        "appends": [], "downloads": [{"url": "a.aac", "bytes": 3000, "ms": 40.0},
+                                     {"url": "b.aac", "bytes": 5000, "ms": 60.0}],
+        "errors": 0,
+    }
+    metrics = summarize(raw)
+    assert metrics["time_to_first_audio_ms"] == 850.0
+    assert (metrics["stalls"], metrics["stall_ms"], metrics["max_stall_ms"]) == (2, 1600.0, 1200.0)
+    assert (metrics["segments"], metrics["avg_segment_bytes"], metrics["avg_segment_ms"]) == (2, 4000.0, 50.0)
+
+    assert check_thresholds(metrics, max_ttfa_ms=1000, max_stalls=2, max_stall_ms=2000) == []
+    assert len(check_thresholds(metrics, max_ttfa_ms=500, max_stalls=1, max_stall_ms=1000)) == 3
+
+    assert check_thresholds(summarize(None), max_ttfa_ms=1000, max_stalls=2, max_stall_ms=2000) == ["audio never started"]
+
+
+def test_thresholds_gate_only_when_budget_is_set(monkeypatch):
+    monkeypatch.delenv("PW_MAX_TTFA_MS", raising=False)
+    assert not thresholds_enabled()
+    monkeypatch.setenv("PW_MAX_TTFA_MS", "8000")
+    assert thresholds_enabled()
@@ -0,0 +1,17 @@
+from utils.selector_registry import SelectorRegistry
+
+
+def test_last_successful_selector_is_tried_first_across_runs(tmp_path):
+    path = str(tmp_path / "selector_stats.json")
+    registry = SelectorRegistry({"home.start_listening": ["a.hashed", "a:has-text('Start Listening')"]}, path=path)
+    assert registry.ordered("home.start_listening") == ["a.hashed", "a:has-text('Start Listening')"]
+
+    registry.record("home.start_listening", "a.hashed", hit=False)
+    registry.record("home.start_listening", "a:has-text('Start Listening')", hit=True, elapsed_ms=12.0)
+    registry.save()
+
+    reloaded = SelectorRegistry({"home.start_listening": ["a.hashed", "a:has-text('Start Listening')"]}, path=path)
+    assert reloaded.ordered("home.start_listening")[0] == "a:has-text('Start Listening')"
+    rows = {r["selector"]: r for r in reloaded.summary()}
+    assert rows["a.hashed"]["misses"] == 1
+    assert rows["a:has-text('Start Listening')"]["avg_ms"] == 12.0
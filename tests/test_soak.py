@@ -0,0 +1,132 @@
+import json
+from utils.soak import FLOWS, SoakRunner, parse_duration, soak, summarize
+
+
+class FakeRunner:
+    def __init__(self):
+        self.heap = 100.0
+
+    async def iteration(self, number):
+        self.heap += 60
+        recycled = None
+        if self.heap > 250:
+            recycled, self.heap = "context over budget", 100.0
+        return {"iteration": number, "ok": number != 3, "latency_ms": 100.0 * number, "js_heap_mb": self.heap,
+                "nodes": 10, "success_rate": 0.0, "recycled": recycled}
+
+
+def test_soak_writes_time_series_and_summary(tmp_path, run_async):
+    assert parse_duration("90") == 90 and parse_duration("15m") == 900 and parse_duration("2h") == 7200
+
+    output = tmp_path / "soak.jsonl"
+    rows = run_async(soak(FakeRunner(), iterations=5, output=str(output)))
+    assert [json.loads(line)["iteration"] for line in output.read_text().splitlines()] == [1, 2, 3, 4, 5]
+
+    summary = summarize(rows)
+    assert summary["iterations"] == 5
+    assert summary["success_rate"] == 0.8
+    assert summary["p50_ms"] == 400.0
+    assert summary["recycles"] == 1
+
+
+class FakeSession:
+    def __init__(self, target):
+        self.target = target
+
+    async def send(self, method, params=None):
+        if method == "Performance.getMetrics":
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": self.target.heap_mb * 1024 * 1024},
+                                {"name": "TaskDuration", "value": 0.0}]}
+        if method == "SystemInfo.getProcessInfo":
+            return {"processInfo": [{"type": "browser", "id": 1, "cpuTime": 0.5}]}
+        return {}
+
+
+class FakePage:
+    def __init__(self, heap_mb):
+        self.heap_mb = heap_mb
+
+    def is_closed(self):
+        return False
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+
+    async def new_page(self):
+        self.pages.append(FakePage(self.browser.base_heap_mb))
+        return self.pages[-1]
+
+    async def new_cdp_session(self, page):
+        return FakeSession(page)
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, base_heap_mb):
+        self.base_heap_mb = base_heap_mb
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_browser_cdp_session(self):
+        return FakeSession(self)
+
+    async def new_context(self, storage_state=None):
+        self.contexts.append(FakeContext(self))
+        return self.contexts[-1]
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """Launches a bloated browser first, then healthy ones."""
+
+    def __init__(self, base_heaps):
+        self.base_heaps = list(base_heaps)
+        self.browsers = []
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        self.browsers.append(FakeBrowser(self.base_heaps.pop(0)))
+        return self.browsers[-1]
+
+
+def test_runner_reuses_one_page_per_context_and_recycles(monkeypatch, run_async):
+    pages = []
+
+    async def leaky_flow(page, base_url, credentials):
+        pages.append(page)
+        page.heap_mb += 60
+        if len(pages) == 5:
+            playwright.browsers[-1].connected = False
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    monkeypatch.setitem(FLOWS, "leaky", leaky_flow)
+    playwright = FakePlaywright([200, 50, 50])
+    runner = SoakRunner(playwright, ["leaky"], heap_budget_mb=150)
+
+    async def run():
+        return [await runner.iteration(n) for n in range(1, 6)]
+
+    rows = run_async(run())
+    assert [r["recycled"] for r in rows] == [
+        "browser over budget (260 MB)",  # a fresh context on the first browser is already over budget
+        None,
+        "context over budget (170 MB)",  # the same page leaked across two iterations
+        None,
+        "browser crashed",
+    ]
+    assert [(r["browser"], r["context"]) for r in rows] == [(1, 1), (2, 2), (2, 2), (2, 3), (2, 3)]
+    assert pages[1] is pages[2] and pages[2] is not pages[3]
+    assert all(len(c.pages) == 1 for b in playwright.browsers for c in b.contexts)
+    assert len(playwright.browsers) == 3
+    assert rows[1]["browser_cpu_ms"] == 0.0
+    assert not rows[4]["ok"] and runner.browser.is_connected()
@@ -0,0 +1,108 @@
+import pytest
+from utils import step_runner
+from utils.step_runner import StepRunner
+
+
+@pytest.fixture(autouse=True)
+def _own_step_reports(monkeypatch):
+    # Keep these fake steps out of the session's step retries summary
+    monkeypatch.setattr(step_runner, "step_reports", [])
+
+
+class FakeContext:
+    def __init__(self):
+        self.cookies = []
+
+    def storage_state(self):
+        return {"cookies": list(self.cookies), "origins": []}
+
+    def clear_cookies(self):
+        self.cookies = []
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+
+class FakePage:
+    def __init__(self):
+        self.url = "about:blank"
+        self.context = FakeContext()
+        self.visited = []
+
+    def wait_for_timeout(self, ms):
+        pass
+
+    def goto(self, url):
+        self.visited.append(url)
+        self.url = url
+
+    def route(self, url, handler):
+        self.visited.append(f"route {url}")
+
+    def unroute(self, url):
+        pass
+
+    def evaluate(self, expression, items):
+        self.visited.append(f"localStorage on {self.url}: {items}")
+
+
+def test_failed_step_retries_from_last_checkpoint():
+    page = FakePage()
+    runner = StepRunner(page, retries=2, backoff_ms=0)
+    page.url = "https://example.com/player/home"
+    page.context.cookies = [{"name": "session", "value": "1"}]
+    runner.run("login", lambda: None)
+
+    calls = []
+
+    def flaky():
+        calls.append((page.url, list(page.context.cookies)))
+        page.url = "https://example.com/player/broken"
+        page.context.cookies = []
+        if len(calls) < 2:
+            raise AssertionError("modal flake")
+        return "played"
+
+    assert runner.run("play", flaky) == "played"
+    checkpoint = ("https://example.com/player/home", [{"name": "session", "value": "1"}])
+    assert calls == [checkpoint, checkpoint]
+    assert runner.reports[-1]["attempts"] == 2
+
+
+def test_step_gives_up_after_retries():
+    runner = StepRunner(FakePage(), retries=1, backoff_ms=0)
+    with pytest.raises(RuntimeError):
+        runner.run("pause", lambda: (_ for _ in ()).throw(RuntimeError("still broken")))
+    assert runner.reports[-1] == {**runner.reports[-1], "ok": False, "attempts": 2}
+
+
+def test_retry_resumes_transient_state_after_restore():
+    page = FakePage()
+    runner = StepRunner(page, retries=1, backoff_ms=0)
+    playing = []
+
+    def metrics():
+        if not playing:
+            playing.append("stopped by restore")
+            raise AssertionError("no audio")
+        return playing
+
+    assert runner.run("playback metrics", metrics, resume=lambda: playing.append("play")) == [
+        "stopped by restore", "play"]
+    assert step_runner.step_reports == runner.reports
+
+
+def test_restore_seeds_local_storage_before_the_app_loads():
+    page = FakePage()
+    page.url = "https://example.com/player/home"
+    runner = StepRunner(page, retries=0, backoff_ms=0)
+    runner._checkpoint["storage_state"]["origins"] = [
+        {"origin": "https://example.com", "localStorage": [{"name": "volume", "value": "3"}]}]
+    page.url = "https://example.com/player/broken"
+    runner.restore()
+
+    blank = "https://example.com/__step_runner_restore__"
+    assert page.visited == [
+        f"route {blank}", blank, f"localStorage on {blank}: [{{'name': 'volume', 'value': '3'}}]",
+        "https://example.com/player/home",
+    ]
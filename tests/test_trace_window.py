@@ -0,0 +1,83 @@
+import os
+from utils.trace_window import TraceWindow
+
+
+class FakeTracing:
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **kwargs):
+        self.calls.append("start")
+
+    def start_chunk(self, title=None):
+        self.calls.append(f"chunk {title}")
+
+    def stop_chunk(self, path=None):
+        if path:
+            with open(path, "w") as f:
+                f.write("zip")
+        self.calls.append("stop_chunk" + (" saved" if path else ""))
+
+    def stop(self):
+        self.calls.append("stop")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+
+def test_window_keeps_last_chunks_only_on_failure(tmp_path):
+    window = TraceWindow(size=2, out_dir=str(tmp_path))
+    window.enabled = True
+
+    passed, failed = FakeContext(), FakeContext()
+    for context in (passed, failed):
+        window.start(context, "test")
+        for label in ("goto", "login", "for you"):
+            window.mark(FakePage(context), label)
+
+    assert window.finish(passed, failed=False, name="tests/test_x.py::test_ok") == []
+    assert passed.tracing.calls[-2:] == ["stop_chunk", "stop"]
+    assert not os.listdir(tmp_path)
+
+    saved = window.finish(failed, failed=True, name="tests/test_x.py::test_fails")
+    assert [os.path.basename(p) for p in saved] == ["01-login.zip", "02-for_you.zip"]
+    assert all(os.path.exists(p) for p in saved)
+
+
+class FakePageObject:
+    def __init__(self, page):
+        self.page = page
+
+    def login(self):
+        self.goto()
+        self.submit()
+
+    def goto(self):
+        pass
+
+    def submit(self):
+        pass
+
+
+def test_only_top_level_page_object_calls_cut_chunks(tmp_path):
+    window = TraceWindow(size=5, out_dir=str(tmp_path))
+    window.enable(FakePageObject)
+    try:
+        context = FakeContext()
+        window.start(context, "test")
+        po = FakePageObject(FakePage(context))
+        po.login()
+        po.goto()
+        assert context.tracing.calls.count("stop_chunk saved") == 2
+        assert context.tracing.calls[-1] == "chunk FakePageObject.goto"
+        assert window.stats()["marks"] == 2
+        window.finish(context, failed=False, name="t")
+    finally:
+        window.disable()
@@ -0,0 +1,50 @@
+import io
+import numpy as np
+from PIL import Image
+from utils.visual import VisualBaselines, diff
+
+
+def _png(pixels) -> bytes:
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, format="PNG", compress_level=1)
+    return out.getvalue()
+
+
+def test_diff_respects_tolerance_and_masks():
+    base = np.zeros((40, 60, 3), dtype=np.uint8)
+    current = base.copy()
+    current[5:10, 20:30] = 200  # a real change
+    current[30:35, 0:5] = 10     # below tolerance
+
+    result = diff(current, base, tolerance=16)
+    assert result["changed"] == 50 and result["bbox"] == (20, 5, 10, 5)
+    assert diff(current, base, tolerance=16, masks=[(20, 5, 10, 5)])["changed"] == 0
+
+
+def test_baselines_skip_identical_frames_and_flag_changes(tmp_path):
+    baselines = VisualBaselines(str(tmp_path), update=False)
+    frame = np.full((80, 120, 3), 240, dtype=np.uint8)
+    frame[10:70, 10:60] = (20, 40, 200)
+
+    assert baselines.check("home", _png(frame))["how"] == "recorded"
+    assert baselines.check("home", _png(frame))["how"] == "identical"
+    assert VisualBaselines(str(tmp_path)).check("home", _png(frame))["how"] == "identical"
+
+    changed = frame.copy()
+    changed[10:70, 70:110] = (200, 20, 20)
+    result = baselines.check("home", _png(changed), max_diff_ratio=0.01)
+    assert result["how"] == "diff" and not result["ok"]
+    assert result["bbox"] == (70, 10, 40, 60)
+
+
+def test_recoloured_frame_of_equal_luminance_fails(tmp_path):
+    baselines = VisualBaselines(str(tmp_path), update=False)
+    frame = np.full((80, 120, 3), 240, dtype=np.uint8)
+    frame[10:70, 10:60] = (0, 0, 255)
+    baselines.check("player", _png(frame))
+
+    # Looks the same in grey scale; only the full colour diff can tell
+    recoloured = frame.copy()
+    recoloured[10:70, 10:60] = (0, 13, 209)
+    result = baselines.check("player", _png(recoloured), max_diff_ratio=0.01)
+    assert result["how"] == "diff" and not result["ok"]
@@ -0,0 +1,91 @@
+import time
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.waits import DOM_QUIET_JS, settle, settle_async, track_network, wait_stats
+
+
+class FakeRequest:
+    resource_type = "xhr"
+
+
+class FakePage:
+    def __init__(self, dom_timeout=False):
+        self.dom_timeout = dom_timeout
+        self.listeners = {}
+        self.calls = []
+
+    def on(self, event, callback):
+        self.listeners[event] = callback
+
+    def wait_for_function(self, expression, arg=None, polling=None, timeout=None):
+        self.calls.append(("wait_for_function", expression))
+        if self.dom_timeout:
+            raise PlaywrightTimeoutError("Timeout exceeded")
+
+    def wait_for_timeout(self, timeout):
+        self.calls.append(("wait_for_timeout", timeout))
+        time.sleep(timeout / 1000)
+
+    def wait_for_url(self, url, timeout=None):
+        self.calls.append(("wait_for_url", url))
+
+
+class AsyncFakePage(FakePage):
+    async def wait_for_function(self, *args, **kwargs):
+        super().wait_for_function(*args, **kwargs)
+
+    async def wait_for_timeout(self, timeout):
+        super().wait_for_timeout(timeout)
+
+    async def wait_for_url(self, *args, **kwargs):
+        super().wait_for_url(*args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _own_wait_stats():
+    # Keep these fake waits out of the session's settle summary
+    saved = wait_stats.records
+    wait_stats.records = []
+    yield
+    wait_stats.records = saved
+
+
+def _quiet_network(page):
+    track_network(page).last_activity -= 10
+
+
+def test_settle_on_a_quiet_page_is_one_in_page_wait():
+    page = FakePage()
+    _quiet_network(page)
+    elapsed_ms = settle(page, label="quiet", quiet_ms=300)
+    assert page.calls == [("wait_for_function", DOM_QUIET_JS)]
+    assert elapsed_ms < 300
+    assert wait_stats.records[-1][0] == "quiet" and not wait_stats.records[-1][2]
+
+
+def test_settle_waits_out_network_activity_then_rechecks_dom():
+    page = FakePage()
+    track_network(page)
+    request = FakeRequest()
+    page.listeners["request"](request)
+    page.listeners["requestfinished"](request)
+    settle(page, url="**/player/home", quiet_ms=50)
+    methods = [method for method, _ in page.calls]
+    assert methods[0] == "wait_for_url"
+    assert "wait_for_timeout" in methods
+    assert methods[-1] == "wait_for_function"
+
+
+def test_settle_timeout_is_recorded_and_optionally_raised():
+    page = FakePage(dom_timeout=True)
+    settle(page, label="stuck", network=False)
+    assert wait_stats.records[-1][0] == "stuck" and wait_stats.records[-1][2]
+    with pytest.raises(PlaywrightTimeoutError):
+        settle(page, label="stuck", network=False, raise_on_timeout=True)
+
+
+def test_settle_async_runs_the_same_waits(run_async):
+    page = AsyncFakePage()
+    _quiet_network(page)
+    run_async(settle_async(page, predicate="() => true"))
+    assert page.calls == [("wait_for_function", "() => true"), ("wait_for_function", DOM_QUIET_JS)]
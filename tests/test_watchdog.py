@@ -0,0 +1,55 @@
+from utils.watchdog import OverlayHandler, OverlayWatchdog, default_handlers
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = []
+
+    def locator(self, selector):
+        return selector
+
+    def add_locator_handler(self, locator, handler, no_wait_after=False, times=None):
+        self.handlers.append((locator, handler))
+
+
+class FakeContext:
+    def __init__(self, pages):
+        self.pages = pages
+        self.listeners = []
+
+    def on(self, event, callback):
+        self.listeners.append((event, callback))
+
+
+def test_handlers_register_once_and_count_fires():
+    clicked = []
+
+    def flaky(target):
+        if clicked:
+            raise RuntimeError("detached")
+        clicked.append(target)
+
+    watchdog = OverlayWatchdog([OverlayHandler("modal", lambda page: page.locator("#modal"), action=flaky)])
+    page = FakePage()
+    context = FakeContext([page])
+    watchdog.install(context)
+    watchdog.install(context)
+    watchdog.attach(page)
+    assert page.handlers[0][0] == "#modal" and len(page.handlers) == 1
+    assert len(context.listeners) == 1
+
+    handler = page.handlers[0][1]
+    handler("#modal")
+    handler("#modal")  # A failing dismissal is counted, not raised into the blocked action
+    assert clicked == ["#modal"]
+    [row] = watchdog.summary()
+    assert (row["fires"], row["errors"]) == (2, 1)
+    assert watchdog.fires("modal") == 2
+
+
+def test_overlay_close_is_scoped_to_player_pages():
+    # The login flow runs inside content-overlay-modal; its close button must not be watched
+    handlers = {h.name: h for h in default_handlers()}
+    selector = handlers["overlay"].locator(FakePage())
+    assert selector.startswith("body:has(button[aria-label^=\"Play\"]")
+    assert selector.endswith('button[data-qa="close-overlay"]')
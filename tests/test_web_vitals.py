@@ -0,0 +1,28 @@
+from utils.web_vitals import METRICS, VitalsRecorder, connect, find_regressions
+
+
+def _sample(label, lcp_ms):
+    sample = {m: 10.0 for m in METRICS}
+    sample.update(label=label, url="https://example.test/", kind="hard", lcp_ms=lcp_ms, recorded_at=0.0)
+    return sample
+
+
+def test_report_flags_only_significant_regressions(tmp_path):
+    path = str(tmp_path / "vitals.sqlite")
+    recorder = VitalsRecorder(path)
+    for run, lcp in enumerate([[1000, 1020, 990], [1010, 1000, 995], [1005, 990, 1015], [1500, 1480, 1530]]):
+        recorder.enable(run_id=f"run-{run}", commit=f"c{run}")
+        for i, value in enumerate(lcp):
+            sample = _sample("home", value)
+            sample["recorded_at"] = run * 10 + i
+            recorder.samples.append(sample)
+        recorder.save()
+
+    db = connect(path)
+    [regression] = find_regressions(db)
+    assert (regression["label"], regression["metric"]) == ("home", "lcp_ms")
+    assert regression["change"] > 0.4
+
+    # The same numbers against an equally slow baseline are not a regression
+    assert find_regressions(db, run_id="run-2") == []
+    db.close()
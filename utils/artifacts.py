@@ -0,0 +1,139 @@
+import atexit
+import hashlib
+import os
+import queue
+import re
+import threading
+
+# Files we write look like <test>-<worker>-<name>-<sha1 prefix>.<ext>; only those are ever evicted
+ARTIFACT_NAME = re.compile(r".+-[0-9a-f]{12}\.(png|jpeg)$")
+
+
+class ArtifactWriter:
+    """
+    Failure screenshots without blocking the flow: the page is captured on the calling
+    thread, hashing and disk writes happen on a background worker. Names are content
+    addressed and tagged by test and xdist worker; a frame already written under another name
+    is hard-linked instead of written again, and the directory is capped at max_bytes by evicting the oldest artifacts first.
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = None, image_type: str = None,
+                 quality: int = None, full_page: bool = None, queue_size: int = 32):
+        self.root = root or os.getenv("PW_ARTIFACT_DIR", os.path.join(os.getcwd(), "debug_screenshots"))
+        self.max_bytes = max_bytes if max_bytes is not None else int(float(os.getenv("PW_ARTIFACT_MAX_MB", "200")) * 1024 * 1024)
+        self.image_type = image_type or os.getenv("PW_SCREENSHOT_FORMAT", "png")
+        self.quality = quality if quality is not None else (int(os.getenv("PW_SCREENSHOT_QUALITY", "0")) or None)
+        self.full_page = full_page if full_page is not None else os.getenv("PW_SCREENSHOT_FULL_PAGE", "true") == "true"
+        self.written = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.evicted = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._seen = {}  # sha1 prefix -> first path written with it
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def capture_options(self, full_page: bool = None) -> dict:
+        options = {"type": self.image_type, "full_page": self.full_page if full_page is None else full_page}
+        if self.image_type == "jpeg" and self.quality:
+            options["quality"] = self.quality
+        return options
+
+    def capture(self, page, name: str, full_page: bool = None) -> str:
+        """Screenshot a sync page and queue it for writing; returns the path it will land at."""
+        try:
+            data = page.screenshot(**self.capture_options(full_page))
+        except Exception as e:
+            print(f"⚠️ Could not capture screenshot '{name}': {e}")
+            return None
+        return self.submit(data, name)
+
+    async def capture_async(self, page, name: str, full_page: bool = None) -> str:
+        """capture() for playwright.async_api pages."""
+        try:
+            data = await page.screenshot(**self.capture_options(full_page))
+        except Exception as e:
+            print(f"⚠️ Could not capture screenshot '{name}': {e}")
+            return None
+        return self.submit(data, name)
+
+    def submit(self, data: bytes, name: str) -> str:
+        digest = hashlib.sha1(data).hexdigest()[:12]
+        path = os.path.join(self.root, f"{self._tag()}-{_slug(name)}-{digest}.{self.image_type}")
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((path, data, digest))
+        except queue.Full:
+            # Never stall a test on disk I/O
+            self.dropped += 1
+            print(f"⚠️ Artifact queue full, dropping screenshot: {path}")
+            return None
+        print(f"Screenshot queued: {path}")
+        return path
+
+    def flush(self):
+        """Block until every queued artifact is on disk."""
+        if self._worker:
+            self._queue.join()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            path, data, digest = self._queue.get()
+            try:
+                if os.path.exists(path):
+                    # Same test, name and content: the file submit() reported is already there
+                    self.duplicates += 1
+                    continue
+                os.makedirs(self.root, exist_ok=True)
+                first = self._seen.get(digest)
+                if first and os.path.exists(first):
+                    # Same frame under another test or name: link it so the reported path exists
+                    try:
+                        os.link(first, path)
+                        self.duplicates += 1
+                        continue
+                    except OSError:
+                        pass
+                self._seen[digest] = path
+                with open(path, "wb") as f:
+                    f.write(data)
+                self.written += 1
+                self._enforce_budget()
+            except Exception as e:
+                print(f"⚠️ Failed to write artifact {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _enforce_budget(self):
+        artifacts = []
+        for entry in os.scandir(self.root):
+            if entry.is_file() and ARTIFACT_NAME.match(entry.name):
+                stat = entry.stat()
+                artifacts.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in artifacts)
+        for _, size, path in sorted(artifacts):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.evicted += 1
+
+    @staticmethod
+    def _tag() -> str:
+        test = os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0].split("::")[-1] or "run"
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return f"{_slug(test)}-{worker}"
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.]+", "_", text).strip("_") or "artifact"
+
+
+artifacts = ArtifactWriter()
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+import time
+from playwright.sync_api import BrowserContext
+from pages import BASE_URL
+from pages.login_page import LoginPage
+
+HOME_URL = f"{BASE_URL}/player/home"
+
+
+# Caches the storage_state produced by a login so the multi-modal LoginPage
+# flow only runs once per account, instead of once per test.
+class AuthStateCache:
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or os.getenv("PW_AUTH_CACHE_DIR", os.path.join(os.getcwd(), ".auth"))
+        self.logins = 0
+        self.reuses = 0
+        self.last_login = None  # {"path": "api" | "ui", "ms": ...} of the most recent fresh login
+
+    def state_path(self, username: str) -> str:
+        """Storage state file for an account (hashed so the email never lands on disk)."""
+        key = hashlib.sha256(username.lower().encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def save(self, context: BrowserContext, username: str) -> str:
+        path = self.state_path(username)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        context.storage_state(path=path)
+        print(f"💾 Saved storage state to: {path}")
+        return path
+
+    def invalidate(self, username: str):
+        path = self.state_path(username)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def get_state(self, pool, username: str, password: str) -> str:
+        """
+        Return a storage_state path that is known to be logged in.
+        Reuses the cached file when the probe passes, otherwise signs in with LoginPage.login(),
+        which follows PW_LOGIN_MODE (the UI flow unless an auth API is configured).
+        """
+        path = self.state_path(username)
+        if os.path.exists(path) and not self._cookies_expired(path):
+            context = pool.acquire(storage_state=path)
+            try:
+                if self.probe(context.new_page()):
+                    print("✅ Reusing cached login session.")
+                    self.reuses += 1
+                    return path
+            finally:
+                pool.release(context)
+            print("⚠️ Cached session expired. Logging in again...")
+
+        context = pool.acquire()
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.login(username, password)
+            self.last_login = login_page.last_login
+            self.logins += 1
+            return self.save(context, username)
+        finally:
+            pool.release(context)
+
+    @staticmethod
+    def probe(page, timeout: int = 10000) -> bool:
+        """Cheap session check: an authenticated user lands on /player/home, not the login page."""
+        try:
+            page.goto(HOME_URL)
+            page.wait_for_url("**/player/home**", timeout=timeout)
+            page.wait_for_selector("a[data-qa='content-nav-for-you']", timeout=timeout)
+            return "/player/login" not in page.url
+        except Exception as e:
+            print(f"⚠️ Session probe failed: {e}")
+            return False
+
+    @staticmethod
+    def _cookies_expired(path: str) -> bool:
+        # Skip the browser probe entirely if every persistent cookie has expired
+        try:
+            with open(path) as f:
+                cookies = json.load(f).get("cookies", [])
+        except (OSError, ValueError):
+            return True
+        expiries = [c["expires"] for c in cookies if c.get("expires", -1) > 0]
+        return bool(expiries) and max(expiries) < time.time()
@@ -0,0 +1,116 @@
+from playwright.sync_api import Browser, BrowserContext
+
+
+# Launching Chromium is the slowest part of every test, so we launch it once per
+# session (or once per xdist worker) and hand out recycled contexts from a pool.
+class BrowserPool:
+    def __init__(self, browser: Browser, size: int = 2, max_uses: int = 10, context_options: dict = None):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1")
+
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self._idle = []
+        self._in_use = set()
+        self._uses = {}
+        self._context_hooks = []
+        self.created = 0
+        self.recycled = 0
+
+    def add_context_hook(self, setup=None, teardown=None):
+        """
+        Per-context setup (routing, handlers, ...): setup(context) runs on every checkout and
+        teardown(context) on every release, so a reused context never keeps the last test's state.
+        """
+        self._context_hooks.append((setup, teardown))
+
+    def acquire(self, dedicated: bool = False, **context_options) -> BrowserContext:
+        """
+        Return a clean context, reusing an idle one when the options allow it.
+        Dedicated contexts (and any with custom options) are closed on release, never shared.
+        """
+        dedicated = dedicated or bool(context_options)
+        if not dedicated:
+            while self._idle:
+                context = self._idle.pop()
+                if self._uses[context] < self.max_uses:
+                    return self._check_out(context)
+                self._close(context)
+
+        if len(self._in_use) + len(self._idle) >= self.size:
+            # Make room by dropping an idle context before refusing
+            if self._idle:
+                self._close(self._idle.pop(0))
+            else:
+                raise RuntimeError(f"Browser pool exhausted: {self.size} context(s) already in use")
+
+        options = {**self.context_options, **context_options}
+        context = self.browser.new_context(**options)
+        self.created += 1
+        self._uses[context] = 0
+        if dedicated:
+            self._uses[context] = self.max_uses - 1
+        return self._check_out(context)
+
+    def release(self, context: BrowserContext):
+        """Return a context to the pool, or close it once it has been used max_uses times."""
+        if context not in self._in_use:
+            return
+        self._in_use.discard(context)
+
+        if self._uses[context] >= self.max_uses:
+            self._close(context)
+            return
+
+        try:
+            self._reset(context)
+        except Exception as e:
+            print(f"⚠️ Could not reset context, discarding it: {e}")
+            self._close(context)
+            return
+
+        self.recycled += 1
+        self._idle.append(context)
+
+    def close(self):
+        """Close every context owned by the pool."""
+        for context in list(self._in_use) + self._idle:
+            self._close(context)
+        self._idle.clear()
+
+    def _check_out(self, context: BrowserContext) -> BrowserContext:
+        self._uses[context] += 1
+        self._in_use.add(context)
+        for setup, _ in self._context_hooks:
+            if setup:
+                setup(context)
+        return context
+
+    def _reset(self, context: BrowserContext):
+        for _, teardown in self._context_hooks:
+            if teardown:
+                teardown(context)
+        # Routes (network policies, HAR replay) are per test
+        context.unroute_all(behavior="ignoreErrors")
+        # Clear web storage on the origins we visited, then drop every page
+        for page in context.pages:
+            try:
+                if page.url.startswith("http"):
+                    page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+            except Exception:
+                pass
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+
+    def _close(self, context: BrowserContext):
+        self._in_use.discard(context)
+        self._uses.pop(context, None)
+        try:
+            context.close()
+        except Exception as e:
+            print(f"⚠️ Error while closing context: {e}")
@@ -0,0 +1,297 @@
+"""
+Long-lived Chromium daemon that test processes attach to instead of cold-launching a browser.
+
+    python -m utils.browser_server start     # spawn the daemon in the background
+    python -m utils.browser_server status
+    python -m utils.browser_server stop
+
+Tests attach with `pytest --browser-server` (or PW_BROWSER_SERVER=true), which also starts
+the daemon on demand. The daemon health-checks Chromium, restarts it if it dies or stops
+answering, and exits after PW_BROWSER_SERVER_IDLE seconds without any client.
+Chromium runs with --no-sandbox only as root or inside a container (override with PW_NO_SANDBOX=true/false).
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from importlib.metadata import version as package_version
+from playwright.sync_api import sync_playwright
+
+STATE_DIR = os.getenv("PW_BROWSER_SERVER_DIR", os.path.join(os.getcwd(), ".cache", "browser_server"))
+STATE_FILE = os.path.join(STATE_DIR, "state.json")
+LEASE_FILE = os.path.join(STATE_DIR, "last_used")
+PLAYWRIGHT_VERSION = package_version("playwright")
+
+
+def read_state():
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_healthy(state, timeout: float = 2.0) -> bool:
+    try:
+        with urllib.request.urlopen(f"{state['endpoint']}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def touch_lease():
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(LEASE_FILE, "a"):
+        os.utime(LEASE_FILE, None)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _needs_no_sandbox() -> bool:
+    # Chromium's sandbox cannot start as root, and most containers lack the namespaces it needs
+    if os.getenv("PW_NO_SANDBOX"):
+        return os.getenv("PW_NO_SANDBOX") == "true"
+    return (hasattr(os, "geteuid") and os.geteuid() == 0) or os.path.exists("/.dockerenv")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        # Reap the daemon if this process spawned it, or it would linger as a zombie
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _open_pages(state) -> int:
+    try:
+        with urllib.request.urlopen(f"{state['endpoint']}/json/list", timeout=2) as response:
+            return sum(1 for t in json.load(response) if t.get("type") == "page" and t.get("url") != "about:blank")
+    except Exception:
+        return 0
+
+
+class BrowserServer:
+    """Supervises one Chromium process exposing the DevTools endpoint on a local port."""
+
+    def __init__(self, port: int = None, idle_timeout: float = 900, headless: bool = True,
+                 health_interval: float = 2.0, max_failed_checks: int = 3):
+        self.port = port or _free_port()
+        self.idle_timeout = idle_timeout
+        self.headless = headless
+        self.health_interval = health_interval
+        self.max_failed_checks = max_failed_checks
+        self.restarts = 0
+        self._process = None
+        self._profile_dir = None
+        self._stopping = threading.Event()
+        with sync_playwright() as p:
+            self.executable = p.chromium.executable_path
+
+    @property
+    def state(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "port": self.port,
+            "endpoint": f"http://127.0.0.1:{self.port}",
+            "executable": self.executable,
+            "browser_pid": self._process.pid if self._process else None,
+            "playwright_version": PLAYWRIGHT_VERSION,
+            "restarts": self.restarts,
+        }
+
+    def _launch(self):
+        self._profile_dir = tempfile.mkdtemp(prefix="pw-browser-server-")
+        args = [
+            self.executable,
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-dev-shm-usage",
+            "--mute-audio",
+        ]
+        if _needs_no_sandbox():
+            args.append("--no-sandbox")
+        if self.headless:
+            args.append("--headless=new")
+        args.append("about:blank")
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def _kill(self):
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+
+    def _write_state(self):
+        os.makedirs(STATE_DIR, exist_ok=True)
+        with open(STATE_FILE, "w") as f:
+            json.dump(self.state, f, indent=2)
+
+    def serve(self):
+        signal.signal(signal.SIGTERM, lambda *_: self._stopping.set())
+        signal.signal(signal.SIGINT, lambda *_: self._stopping.set())
+        self._launch()
+        self._write_state()
+        touch_lease()
+        failed_checks = 0
+        try:
+            # Event.wait returns as soon as a signal sets it, unlike time.sleep
+            while not self._stopping.wait(self.health_interval):
+                healthy = self._process.poll() is None and is_healthy(self.state)
+                failed_checks = 0 if healthy else failed_checks + 1
+                if failed_checks >= self.max_failed_checks:
+                    print(f"🔁 Chromium unhealthy, restarting (restart #{self.restarts + 1})")
+                    self._kill()
+                    self._launch()
+                    self.restarts += 1
+                    failed_checks = 0
+                    self._write_state()
+                    continue
+
+                idle_for = time.time() - os.path.getmtime(LEASE_FILE) if os.path.exists(LEASE_FILE) else 0
+                if _open_pages(self.state):
+                    touch_lease()
+                elif idle_for > self.idle_timeout:
+                    print(f"💤 Idle for {idle_for:.0f}s, shutting down.")
+                    break
+        finally:
+            self._kill()
+            if read_state() and read_state().get("pid") == os.getpid():
+                os.remove(STATE_FILE)
+
+
+def start(idle_timeout: float = None, headless: bool = True, wait: float = 30.0) -> dict:
+    """Spawn the daemon in the background (if it is not already healthy) and return its state."""
+    state = read_state()
+    if state and is_healthy(state):
+        return state
+    idle_timeout = idle_timeout if idle_timeout is not None else float(os.getenv("PW_BROWSER_SERVER_IDLE", "900"))
+    os.makedirs(STATE_DIR, exist_ok=True)
+    if os.path.exists(STATE_FILE):
+        os.remove(STATE_FILE)
+    command = [sys.executable, "-m", "utils.browser_server", "serve", "--idle-timeout", str(idle_timeout)]
+    if not headless:
+        command.append("--headed")
+    with open(os.path.join(STATE_DIR, "server.log"), "a") as log:
+        subprocess.Popen(command, stdout=log, stderr=log, start_new_session=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        state = read_state()
+        if state and is_healthy(state):
+            print(f"🚀 Browser server ready at {state['endpoint']}")
+            return state
+        time.sleep(0.2)
+    raise RuntimeError(f"Browser server did not become healthy within {wait}s (see {STATE_DIR}/server.log)")
+
+
+def stop(wait: float = 10.0):
+    """
+    Stop the daemon and return only once it has exited and its state file is gone, so a
+    start() right after cannot pick up the old endpoint. Kills it (and its Chromium) if it
+    does not exit within `wait` seconds.
+    """
+    state = read_state()
+    if not state:
+        print("Browser server is not running.")
+        return
+    pid = state["pid"]
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    deadline = time.time() + wait
+    while _pid_alive(pid) and time.time() < deadline:
+        time.sleep(0.05)
+    if _pid_alive(pid):
+        print(f"⚠️ Browser server (pid {pid}) did not exit within {wait:.0f}s. Killing it.")
+        for victim in (pid, state.get("browser_pid")):
+            try:
+                if victim:
+                    os.kill(victim, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        while _pid_alive(pid):
+            time.sleep(0.05)
+    try:
+        os.remove(STATE_FILE)
+    except FileNotFoundError:
+        pass
+    print(f"🛑 Stopped browser server (pid {pid}).")
+
+
+def attach(playwright, autostart: bool = True, headless: bool = True):
+    """
+    Connect to the daemon over CDP, starting it if needed. A daemon built for a different
+    playwright version or Chromium build is restarted so client and browser stay pinned.
+    """
+    state = read_state()
+    pinned = state and state["playwright_version"] == PLAYWRIGHT_VERSION \
+        and state["executable"] == playwright.chromium.executable_path
+    if state and not pinned:
+        print("⚠️ Browser server was started by another playwright/Chromium version. Restarting it.")
+        stop()
+        state = None
+    if not state or not is_healthy(state):
+        if not autostart:
+            raise RuntimeError("Browser server is not running; start it with `python -m utils.browser_server start`")
+        state = start(headless=headless)
+    touch_lease()
+    return playwright.chromium.connect_over_cdp(state["endpoint"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument("--idle-timeout", type=float, default=float(os.getenv("PW_BROWSER_SERVER_IDLE", "900")))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        BrowserServer(idle_timeout=args.idle_timeout, headless=not args.headed).serve()
+    elif args.command == "start":
+        start(args.idle_timeout, headless=not args.headed)
+    elif args.command == "stop":
+        stop()
+    else:
+        state = read_state()
+        if state and is_healthy(state):
+            print(json.dumps(state, indent=2))
+        else:
+            print("Browser server is not running.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import json
+import os
+import time
+from urllib.parse import urlsplit
+from pages.for_you_page import ForYouPage
+
+
+# Channel hrefs (/player/channel-linear/<slug>/<uuid>) rarely change, so once a
+# carousel search has resolved one we keep it on disk and navigate to it directly.
+class ChannelIndex:
+    def __init__(self, path: str = None, ttl: float = None):
+        self.path = path or os.getenv("PW_CHANNEL_INDEX", os.path.join(os.getcwd(), ".cache", "channel_index.json"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("PW_CHANNEL_INDEX_TTL", str(7 * 24 * 3600)))
+        self.hits = 0
+        self.misses = 0
+        self._entries = self._load()
+
+    def get(self, slug: str):
+        """Returns the cached href for a slug, or None if unknown or older than the TTL."""
+        entry = self._entries.get(slug)
+        if not entry or time.time() - entry["resolved_at"] > self.ttl:
+            return None
+        return entry["href"]
+
+    def record(self, slug: str, href: str):
+        self.record_many({slug: href})
+
+    def record_many(self, channels: dict):
+        now = time.time()
+        for slug, href in channels.items():
+            self._entries[slug] = {"href": href, "resolved_at": now}
+        self._save()
+
+    def invalidate(self, slug: str):
+        if self._entries.pop(slug, None):
+            self._save()
+
+    def open_channel(self, for_you_page: ForYouPage, channel_slugs: list):
+        """
+        Opens the first channel from channel_slugs, preferring direct navigation to an indexed href.
+        Falls back to the For You carousel search (and refreshes the index) when the index is stale.
+        Returns the slug that was opened, or None.
+        """
+        for slug in channel_slugs:
+            href = self.get(slug)
+            if not href:
+                continue
+            print(f"📇 Opening {slug} from channel index: {href}")
+            if for_you_page.goto_channel(href):
+                self.hits += 1
+                return slug
+            print(f"⚠️ Indexed href for {slug} is stale. Dropping it.")
+            self.invalidate(slug)
+
+        self.misses += 1
+        page = for_you_page.page
+        if "/for-you" not in page.url:
+            for_you_page.click_for_you_nav()
+
+        # Every rendered channel link is free to index while we are here
+        self.record_many(for_you_page.get_channel_hrefs())
+        slug = for_you_page.click_first_matching_channel(channel_slugs)
+        if slug:
+            page.wait_for_url("**/player/channel-linear/**", timeout=10000)
+            self.record(slug, urlsplit(page.url).path)
+        return slug
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,125 @@
+import re
+import weakref
+from collections import deque
+
+CHANNEL_HREF = re.compile(r"/player/channel-linear/([^/?#\"']+)/([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})")
+UUID = re.compile(r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$")
+SLUG_KEYS = ("slug", "urlSlug", "channelSlug", "seoSlug")
+ID_KEYS = ("channelId", "entityId", "id", "guid")
+TYPE_KEYS = ("type", "entityType", "kind", "__typename")
+TITLE_KEYS = ("title", "name", "displayName", "longTitle")
+CONTENT_TYPES = {"fetch", "xhr"}
+
+
+def _title(node: dict):
+    return next((node[k] for k in TITLE_KEYS if isinstance(node.get(k), str)), None)
+
+
+class ContentIndex:
+    """
+    slug -> {href, title, carousel, position, built} built from the JSON payloads that fill the carousels.
+    Responses are only queued by the listener; bodies are fetched and parsed on refresh(), so
+    pages that never look a channel up pay nothing. The queue keeps the newest max_pending
+    responses, so a long-lived page does not pin every JSON response it ever saw.
+    An href spelled out in the payload is trusted. One assembled from entity fields is "built":
+    a guess at the URL scheme, so it is left out of hrefs() until confirm()ed by opening it.
+    """
+
+    def __init__(self, page=None, max_pending: int = 50):
+        self.entries = {}
+        self.rejected = set()
+        self.pending = deque(maxlen=max_pending)
+        self.dropped = 0
+        self.parsed = 0
+        if page is not None:
+            page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if response.request.resource_type in CONTENT_TYPES and response.ok \
+                and "json" in response.headers.get("content-type", ""):
+            if len(self.pending) == self.pending.maxlen:
+                self.dropped += 1
+            self.pending.append(response)
+
+    def refresh(self):
+        pending, self.pending = self.pending, deque(maxlen=self.pending.maxlen)
+        for response in pending:
+            try:
+                self.ingest(response.json())
+            except Exception:
+                # Bodies of responses from a previous document are no longer available
+                continue
+
+    async def refresh_async(self):
+        pending, self.pending = self.pending, deque(maxlen=self.pending.maxlen)
+        for response in pending:
+            try:
+                self.ingest(await response.json())
+            except Exception:
+                continue
+
+    def ingest(self, payload):
+        self.parsed += 1
+        self._walk(payload, carousel=None, position=0)
+
+    def get(self, slug: str):
+        return self.entries.get(slug)
+
+    def hrefs(self) -> dict:
+        return {slug: entry["href"] for slug, entry in self.entries.items() if not entry["built"]}
+
+    def confirm(self, slug: str):
+        """A built href opened the channel page, so it can be handed out like a payload href."""
+        self.entries[slug]["built"] = False
+
+    def drop(self, slug: str):
+        """A built href did not open the channel; forget it and do not build it again."""
+        self.rejected.add(self.entries.pop(slug)["href"])
+
+    def _walk(self, node, carousel, position):
+        if isinstance(node, list):
+            for i, item in enumerate(node):
+                self._walk(item, carousel, i)
+            return
+        if not isinstance(node, dict):
+            return
+
+        entry = self._entry(node)
+        if entry:
+            slug, href, built = entry
+            known = self.entries.get(slug)
+            if (known is None or (known["built"] and not built)) and href not in self.rejected:
+                self.entries[slug] = {"href": href, "title": _title(node), "carousel": carousel,
+                                      "position": position, "built": built}
+        # A titled object holding a list is a carousel (or shelf) for everything below it
+        title = _title(node)
+        for value in node.values():
+            if isinstance(value, list):
+                self._walk(value, title if title is not None and not entry else carousel, 0)
+            elif isinstance(value, dict):
+                self._walk(value, carousel, position)
+
+    @staticmethod
+    def _entry(node: dict):
+        for value in node.values():
+            if isinstance(value, str):
+                match = CHANNEL_HREF.search(value)
+                if match:
+                    return match.group(1), match.group(0), False
+        kind = next((str(node[k]).lower() for k in TYPE_KEYS if k in node), "")
+        slug = next((node[k] for k in SLUG_KEYS if isinstance(node.get(k), str)), None)
+        entity_id = next((node[k] for k in ID_KEYS if isinstance(node.get(k), str) and UUID.match(node[k])), None)
+        if "channel" in kind and slug and entity_id:
+            return slug, f"/player/channel-linear/{slug}/{entity_id}", True
+        return None
+
+
+_indexes = weakref.WeakKeyDictionary()
+
+
+def track_content(page) -> ContentIndex:
+    """Attach (once) and return the content index for a page."""
+    index = _indexes.get(page)
+    if index is None:
+        index = _indexes[page] = ContentIndex(page)
+    return index
@@ -0,0 +1,138 @@
+"""
+Runs many independent page-object flows concurrently, each in its own context of one browser.
+
+    python -m utils.flow_runner --flows home,for-you,login --repeat 10 --concurrency 8
+    python -m utils.flow_runner --base-url http://127.0.0.1:8000 --flows for-you --repeat 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from playwright.async_api import async_playwright
+from pages import BASE_URL
+from pages.async_for_you_page import AsyncForYouPage
+from pages.async_home_page import AsyncHomePage
+from pages.async_login_page import AsyncLoginPage
+from utils.auth_cache import AuthStateCache
+
+PREFERRED_CHANNELS = ["siriusxm-hits-1", "pop2K", "80s-on-8", "90s-on-9", "tiktok-radio", "unwell-radio"]
+
+
+async def home_flow(page, base_url, credentials):
+    home_page = AsyncHomePage(page, base_url)
+    await home_page.goto()
+    assert await home_page.is_nav_visible()
+    assert await home_page.click_discover_button()
+    await home_page.click_start_listening()
+
+
+async def login_flow(page, base_url, credentials):
+    await AsyncLoginPage(page, base_url).login(*credentials)
+
+
+async def for_you_flow(page, base_url, credentials):
+    await page.goto(f"{base_url}/player/home")
+    if "/player/login" in page.url:
+        await AsyncLoginPage(page, base_url).login(*credentials)
+
+    for_you_page = AsyncForYouPage(page, base_url)
+    await for_you_page.click_for_you_nav()
+    if not await for_you_page.click_first_matching_channel(PREFERRED_CHANNELS):
+        assert await for_you_page.click_first_player_link(), "No playable content found in carousels."
+
+    play_button = page.locator('button[aria-label^="Play"]:visible').first
+    await play_button.click()
+    await page.locator('button[aria-label^="Pause"]:visible').first.wait_for(state="visible", timeout=10000)
+
+
+FLOWS = {"home": home_flow, "login": login_flow, "for-you": for_you_flow}
+
+
+async def run_flows(browser, plan: list, concurrency: int = 4, base_url: str = BASE_URL,
+                    credentials=(None, None), storage_state: str = None) -> list:
+    """
+    Run every flow name in plan in its own context, at most `concurrency` at a time.
+    Returns one {"flow", "ok", "ms", "error"} dict per flow, in plan order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(name):
+        async with semaphore:
+            # Login flows must start signed out; the rest reuse the cached session if there is one
+            state = storage_state if name != "login" else None
+            context = await browser.new_context(storage_state=state)
+            page = await context.new_page()
+            start = time.perf_counter()
+            try:
+                await FLOWS[name](page, base_url, credentials)
+                return {"flow": name, "ok": True, "ms": (time.perf_counter() - start) * 1000, "error": None}
+            except Exception as e:
+                return {"flow": name, "ok": False, "ms": (time.perf_counter() - start) * 1000, "error": str(e)}
+            finally:
+                await context.close()
+
+    return await asyncio.gather(*(run_one(name) for name in plan))
+
+
+def summarize(results: list, wall_ms: float) -> list:
+    rows = []
+    for name in dict.fromkeys(r["flow"] for r in results):
+        runs = [r for r in results if r["flow"] == name]
+        ok = [r["ms"] for r in runs if r["ok"]]
+        rows.append({
+            "flow": name,
+            "runs": len(runs),
+            "ok": len(ok),
+            "median_ms": statistics.median(ok) if ok else None,
+        })
+    rows.append({"flow": "TOTAL", "runs": len(results), "ok": sum(r["ok"] for r in results),
+                 "flows_per_sec": len(results) / (wall_ms / 1000) if wall_ms else 0.0})
+    return rows
+
+
+async def main_async(args) -> int:
+    plan = [name for _ in range(args.repeat) for name in args.flows.split(",")]
+    username, password = os.getenv("SIRIUSXM_USERNAME"), os.getenv("SIRIUSXM_PASSWORD")
+    state_path = AuthStateCache().state_path(username) if username else None
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=not args.headed)
+        try:
+            start = time.perf_counter()
+            results = await run_flows(
+                browser, plan, args.concurrency, args.base_url, (username, password),
+                storage_state=state_path if state_path and os.path.exists(state_path) else None,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+        finally:
+            await browser.close()
+
+    for r in results:
+        if not r["ok"]:
+            print(f"❌ {r['flow']} failed after {r['ms']:.0f} ms: {r['error']}")
+    for row in summarize(results, wall_ms):
+        print(row)
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flows", default="home,for-you", help=f"Comma-separated, from: {', '.join(FLOWS)}")
+    parser.add_argument("--repeat", type=int, default=1, help="How many times to run each flow")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    unknown = set(args.flows.split(",")) - set(FLOWS)
+    if unknown:
+        parser.error(f"Unknown flow(s): {', '.join(sorted(unknown))}")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    if os.getenv("CI") != "true":
+        from dotenv import load_dotenv
+        load_dotenv()
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import os
+import re
+from playwright.sync_api import BrowserContext
+
+HAR_MODES = ("off", "record", "replay")
+
+
+def har_path(har_dir: str, nodeid: str) -> str:
+    """One archive per test, e.g. tests/test_login_page.py::test_full_login_flow -> test_login_page__test_full_login_flow.har"""
+    name = nodeid.split("/")[-1].replace(".py::", "__")
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+    return os.path.join(har_dir, f"{name}.har")
+
+
+def attach_har(context: BrowserContext, path: str, mode: str, strict: bool = True):
+    """
+    record: capture every response into the archive (written when the context closes).
+    replay: serve requests from the archive; strict aborts anything missing, lenient falls back to the network.
+    """
+    if mode == "record":
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        context.route_from_har(path, update=True, update_content="embed", update_mode="minimal")
+    elif mode == "replay":
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No HAR archive recorded at {path}; run with --har-mode=record first")
+        context.route_from_har(path, not_found="abort" if strict else "fallback")
+    elif mode != "off":
+        raise ValueError(f"Unknown HAR mode '{mode}', expected one of {HAR_MODES}")
@@ -0,0 +1,144 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from utils.ipc_counter import count_ipc
+
+
+class _ResponseBytes:
+    """Running total of response bytes for a page, from the content-length header."""
+
+    def __init__(self, page):
+        self.total = 0
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        self.total += int(response.headers.get("content-length", 0) or 0)
+
+
+class Profiler:
+    """
+    Records a timed step for every instrumented page-object method and every explicit step().
+    Each step carries wall time, Playwright round trips, wait vs act time and response bytes.
+    Disabled by default; when disabled nothing is patched and step() is a no-op.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self._start = time.perf_counter()
+        self._depth = 0
+        self._bytes = weakref.WeakKeyDictionary()
+        self._instrumented = []
+
+    def enable(self, *classes):
+        self.enabled = True
+        self._start = time.perf_counter()
+        for cls in classes:
+            self.instrument(cls)
+
+    def disable(self):
+        for cls, name, original in self._instrumented:
+            setattr(cls, name, original)
+        self._instrumented.clear()
+        self.enabled = False
+
+    def instrument(self, cls):
+        """Wrap every public method defined on cls (sync or async) in a step named Class.method."""
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", member))
+            self._instrumented.append((cls, name, member))
+
+    def _wrap(self, step_name, fn):
+        profiler = self
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(po, *args, **kwargs):
+                with profiler.step(step_name, getattr(po, "page", None)):
+                    return await fn(po, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(po, *args, **kwargs):
+            with profiler.step(step_name, getattr(po, "page", None)):
+                return fn(po, *args, **kwargs)
+        return wrapper
+
+    def step(self, name: str, page=None):
+        """Context manager timing a named step; pass page to also count its response bytes."""
+        if not self.enabled:
+            return nullcontext()
+        return self._step(name, page)
+
+    @contextmanager
+    def _step(self, name, page):
+        tracker = None
+        if page is not None:
+            tracker = self._bytes.get(page)
+            if tracker is None:
+                tracker = self._bytes[page] = _ResponseBytes(page)
+        bytes_before = tracker.total if tracker else 0
+        self._depth += 1
+        start = time.perf_counter()
+        error = None
+        try:
+            with count_ipc() as ipc:
+                yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            end = time.perf_counter()
+            self._depth -= 1
+            self.events.append({
+                "name": name,
+                "ts_us": (start - self._start) * 1e6,
+                "dur_us": (end - start) * 1e6,
+                "depth": self._depth,
+                "round_trips": ipc.round_trips,
+                "wait_ms": round(ipc.wait_ms, 1),
+                "act_ms": round(ipc.act_ms, 1),
+                "bytes": (tracker.total - bytes_before) if tracker else 0,
+                "error": error,
+            })
+
+    def write_chrome_trace(self, path: str):
+        """Write the steps as Chrome trace events (open in chrome://tracing or Perfetto)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        trace = {"traceEvents": [{
+            "name": e["name"],
+            "cat": "page-object" if "." in e["name"] else "step",
+            "ph": "X",
+            "ts": e["ts_us"],
+            "dur": e["dur_us"],
+            "pid": pid,
+            "tid": tid,
+            "args": {k: e[k] for k in ("round_trips", "wait_ms", "act_ms", "bytes", "error")},
+        } for e in self.events], "displayTimeUnit": "ms"}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(trace, f)
+
+    def summary(self) -> list:
+        rows = {}
+        for e in self.events:
+            row = rows.setdefault(e["name"], {"step": e["name"], "calls": 0, "total_ms": 0.0, "round_trips": 0,
+                                              "wait_ms": 0.0, "act_ms": 0.0, "bytes": 0, "errors": 0})
+            row["calls"] += 1
+            row["total_ms"] += e["dur_us"] / 1000
+            row["round_trips"] += e["round_trips"]
+            row["wait_ms"] += e["wait_ms"]
+            row["act_ms"] += e["act_ms"]
+            row["bytes"] += e["bytes"]
+            row["errors"] += int(e["error"] is not None)
+        return sorted(rows.values(), key=lambda r: r["total_ms"], reverse=True)
+
+
+profiler = Profiler()
+step = profiler.step
@@ -0,0 +1,77 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from importlib.metadata import version as package_version
+
+# Playwright has no public hook for protocol traffic, so we count the messages the
+# client sends to the driver. Every one of them is a round trip unless no_reply is set.
+# This relies on a private method; requirements.txt pins the playwright minor it was written against.
+try:
+    from playwright._impl._connection import Connection
+except ImportError:
+    Connection = None
+_original_send = getattr(Connection, "_send_message_to_server", None)
+_counters = []
+
+# Protocol methods that spend their time waiting on the page rather than acting on it
+WAIT_METHODS = {
+    "waitForSelector", "waitForFunction", "waitForTimeout", "waitForEventInfo",
+    "waitForLoadState", "waitForURL", "expect",
+}
+
+
+def _counting_send(self, object, method, params, timeout, no_reply=False, *args, **kwargs):
+    counters = list(_counters)
+    for counter in counters:
+        counter.record(method, no_reply)
+    callback = _original_send(self, object, method, params, timeout, no_reply, *args, **kwargs)
+    if not no_reply and counters:
+        start = time.perf_counter()
+
+        def on_done(_future):
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for counter in counters:
+                counter.record_duration(method, elapsed_ms)
+
+        callback.future.add_done_callback(on_done)
+    return callback
+
+
+class IpcCounter:
+    def __init__(self):
+        self.round_trips = 0
+        self.messages = 0
+        self.by_method = Counter()
+        self.wait_ms = 0.0
+        self.act_ms = 0.0
+
+    def record(self, method: str, no_reply: bool):
+        self.messages += 1
+        self.by_method[method] += 1
+        if not no_reply:
+            self.round_trips += 1
+
+    def record_duration(self, method: str, elapsed_ms: float):
+        if method in WAIT_METHODS:
+            self.wait_ms += elapsed_ms
+        else:
+            self.act_ms += elapsed_ms
+
+
+@contextmanager
+def count_ipc():
+    """Count Playwright client -> driver messages (and their round-trip time) sent inside the block."""
+    if _original_send is None:
+        raise RuntimeError(
+            f"IPC counting hooks playwright's private Connection._send_message_to_server, which "
+            f"playwright {package_version('playwright')} does not have. Install the version pinned in requirements.txt."
+        )
+    counter = IpcCounter()
+    _counters.append(counter)
+    Connection._send_message_to_server = _counting_send
+    try:
+        yield counter
+    finally:
+        _counters.remove(counter)
+        if not _counters:
+            Connection._send_message_to_server = _original_send
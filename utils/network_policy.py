@@ -0,0 +1,97 @@
+import fnmatch
+import weakref
+from collections import Counter
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Route
+
+# Third parties our flows never need: analytics, tag managers, ads and the OneTrust banner
+TRACKER_HOSTS = [
+    "*.google-analytics.com", "*.googletagmanager.com", "*.googlesyndication.com",
+    "*.doubleclick.net", "*.facebook.net", "*.facebook.com", "*.adobedtm.com",
+    "*.omtrdc.net", "*.demdex.net", "*.everesttech.net", "*.hotjar.com",
+    "*.nr-data.net", "*.newrelic.com", "*.segment.io", "*.branch.io",
+    "*.tiktok.com", "*.snapchat.com", "*.pinterest.com", "*.bing.com",
+    "*.onetrust.com", "*.cookielaw.org",
+]
+
+_installed = weakref.WeakKeyDictionary()
+
+
+class NetworkPolicy:
+    """Blocks requests by resource type and host pattern; allow_hosts always wins."""
+
+    def __init__(self, name: str, block_types=(), block_hosts=(), allow_hosts=()):
+        self.name = name
+        self.block_types = set(block_types)
+        self.block_hosts = list(block_hosts)
+        self.allow_hosts = list(allow_hosts)
+        self.requests = 0
+        self.blocked = 0
+        self.blocked_by_type = Counter()
+        self.blocked_by_host = Counter()
+        self.allowed_bytes = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        host = urlsplit(url).hostname or ""
+        if self._matches(host, self.allow_hosts):
+            return False
+        return resource_type in self.block_types or self._matches(host, self.block_hosts)
+
+    def apply(self, context: BrowserContext):
+        """Install this policy on a context, replacing any policy installed before."""
+        if _installed.get(context) is self:
+            return
+        clear_policy(context)
+        _installed[context] = self
+        context.on("response", self._on_response)
+        if self.block_types or self.block_hosts:
+            context.route("**/*", self._handle)
+
+    def _handle(self, route: Route):
+        request = route.request
+        self.requests += 1
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            self.blocked_by_type[request.resource_type] += 1
+            self.blocked_by_host[urlsplit(request.url).hostname or ""] += 1
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def _on_response(self, response):
+        # content-length is already in the local headers dict, so this costs no round trip
+        self.allowed_bytes += int(response.headers.get("content-length", 0) or 0)
+
+    @staticmethod
+    def _matches(host: str, patterns: list) -> bool:
+        return any(fnmatch.fnmatch(host, p) or fnmatch.fnmatch(host, p.lstrip("*.")) for p in patterns)
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.name,
+            "requests": self.requests,
+            "blocked": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "top_blocked_hosts": self.blocked_by_host.most_common(5),
+            "allowed_bytes": self.allowed_bytes,
+        }
+
+
+def clear_policy(context: BrowserContext):
+    """Remove whichever policy is installed on a context (a no-op when there is none)."""
+    policy = _installed.pop(context, None)
+    if policy is not None:
+        context.unroute("**/*", policy._handle)
+        context.remove_listener("response", policy._on_response)
+
+
+def build_policies() -> dict:
+    """Named policies; a fresh set per session so the counters stay separate."""
+    heavy_assets = ["image", "media", "font"]
+    return {
+        "full": NetworkPolicy("full"),
+        "no-media": NetworkPolicy("no-media", block_types=heavy_assets),
+        # Keeps audio streams so playback checks still work
+        "playback": NetworkPolicy("playback", block_types=["image", "font"], block_hosts=TRACKER_HOSTS),
+        "minimal": NetworkPolicy("minimal", block_types=heavy_assets, block_hosts=TRACKER_HOSTS),
+    }
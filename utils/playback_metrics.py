@@ -0,0 +1,122 @@
+import os
+
+# Installed as an init script and evaluated once in the current document, since channel
+# pages are usually reached by client-side navigation that never reloads the document.
+PLAYBACK_METRICS_JS = """(() => {
+    if (window.__pwPlayback) return;
+    const m = window.__pwPlayback = {
+        playRequested: null, firstAudio: null, stalls: [], stallStart: null,
+        appends: [], downloads: [], errors: 0,
+    };
+    const now = () => performance.now();
+    const SEGMENT = /\\.(aac|m4s|m4a|mp4|ts|mp3|ogg|opus)(\\?|$)/i;
+    const TYPES = ['play', 'playing', 'timeupdate', 'waiting', 'stalled', 'error'];
+
+    const onEvent = e => {
+        const el = e.target;
+        if (!(el instanceof HTMLMediaElement) || e.__pwSeen) return;
+        e.__pwSeen = true;
+        const t = now();
+        if (e.type === 'play' && m.playRequested === null) m.playRequested = t;
+        if (e.type === 'error') m.errors++;
+        if ((e.type === 'waiting' || e.type === 'stalled') && m.firstAudio !== null && m.stallStart === null) {
+            m.stallStart = t;
+        }
+        if ((e.type === 'playing' || e.type === 'timeupdate') && el.currentTime > 0 && !el.paused) {
+            if (m.firstAudio === null) m.firstAudio = t;
+            if (m.stallStart !== null) {
+                m.stalls.push(t - m.stallStart);
+                m.stallStart = null;
+            }
+        }
+    };
+    TYPES.forEach(type => document.addEventListener(type, onEvent, true));
+
+    // Audio() elements that are never attached to the document only report to themselves
+    const play = HTMLMediaElement.prototype.play;
+    HTMLMediaElement.prototype.play = function () {
+        if (m.playRequested === null) m.playRequested = now();
+        if (!this.__pwWatched) {
+            this.__pwWatched = true;
+            TYPES.forEach(type => this.addEventListener(type, onEvent));
+        }
+        return play.apply(this, arguments);
+    };
+
+    if (window.SourceBuffer) {
+        const append = SourceBuffer.prototype.appendBuffer;
+        SourceBuffer.prototype.appendBuffer = function (data) {
+            m.appends.push(data ? data.byteLength : 0);
+            return append.apply(this, arguments);
+        };
+    }
+
+    new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) {
+            if (SEGMENT.test(entry.name)) {
+                m.downloads.push({url: entry.name, bytes: entry.transferSize || entry.encodedBodySize, ms: entry.duration});
+            }
+        }
+    }).observe({type: 'resource', buffered: true});
+})()"""
+
+COLLECT_JS = """() => {
+    const m = window.__pwPlayback;
+    if (!m) return null;
+    const stalls = m.stallStart === null ? m.stalls : m.stalls.concat([performance.now() - m.stallStart]);
+    return {
+        playRequested: m.playRequested, firstAudio: m.firstAudio, stalls,
+        appends: m.appends, downloads: m.downloads, errors: m.errors,
+    };
+}"""
+
+FIRST_AUDIO_JS = "() => !!(window.__pwPlayback && window.__pwPlayback.firstAudio !== null)"
+
+
+def summarize(raw: dict) -> dict:
+    """Turn the collector's raw samples into the numbers the thresholds are checked against."""
+    raw = raw or {}
+    started, first_audio = raw.get("playRequested"), raw.get("firstAudio")
+    stalls = raw.get("stalls") or []
+    appends = raw.get("appends") or []
+    downloads = raw.get("downloads") or []
+    # Prefer what MediaSource actually received; plain <audio src> players only show downloads
+    segment_bytes = appends or [d["bytes"] for d in downloads]
+    return {
+        "time_to_first_audio_ms": first_audio - started if started is not None and first_audio is not None else None,
+        "stalls": len(stalls),
+        "stall_ms": sum(stalls),
+        "max_stall_ms": max(stalls, default=0.0),
+        "segments": len(segment_bytes),
+        "segment_bytes": sum(segment_bytes),
+        "avg_segment_bytes": sum(segment_bytes) / len(segment_bytes) if segment_bytes else 0.0,
+        "avg_segment_ms": sum(d["ms"] for d in downloads) / len(downloads) if downloads else 0.0,
+        "errors": raw.get("errors", 0),
+    }
+
+
+def thresholds_enabled() -> bool:
+    """Playback metrics are only recorded unless a budget is set; PW_MAX_TTFA_MS turns the gate on."""
+    return bool(os.getenv("PW_MAX_TTFA_MS"))
+
+
+def check_thresholds(metrics: dict, max_ttfa_ms: float = None, max_stalls: int = None,
+                     max_stall_ms: float = None) -> list:
+    """Returns one message per broken threshold (empty when playback is within budget)."""
+    max_ttfa_ms = max_ttfa_ms if max_ttfa_ms is not None else float(os.getenv("PW_MAX_TTFA_MS", "8000"))
+    max_stalls = max_stalls if max_stalls is not None else int(os.getenv("PW_MAX_STALLS", "2"))
+    max_stall_ms = max_stall_ms if max_stall_ms is not None else float(os.getenv("PW_MAX_STALL_MS", "5000"))
+
+    problems = []
+    ttfa = metrics["time_to_first_audio_ms"]
+    if ttfa is None:
+        problems.append("audio never started")
+    elif ttfa > max_ttfa_ms:
+        problems.append(f"time to first audio {ttfa:.0f} ms > {max_ttfa_ms:.0f} ms")
+    if metrics["stalls"] > max_stalls:
+        problems.append(f"{metrics['stalls']} stalls > {max_stalls}")
+    if metrics["stall_ms"] > max_stall_ms:
+        problems.append(f"stalled for {metrics['stall_ms']:.0f} ms > {max_stall_ms:.0f} ms")
+    if metrics["errors"]:
+        problems.append(f"{metrics['errors']} media error(s)")
+    return problems
@@ -0,0 +1,141 @@
+import json
+import os
+import time
+from pages.locators import LOCATORS
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+class SelectorRegistry:
+    """
+    Resolves logical element names to ranked fallback selectors. Candidates are probed
+    without waiting, the one that worked last is tried first, and when nothing is there yet
+    a single wait covers every candidate at once, so markup drift costs no extra timeouts.
+    Hit/miss/latency stats persist between runs.
+    """
+
+    def __init__(self, locators: dict = None, path: str = None):
+        self.locators = {name: list(candidates) for name, candidates in (locators or LOCATORS).items()}
+        self.path = path or os.getenv("PW_SELECTOR_STATS", os.path.join(os.getcwd(), ".cache", "selector_stats.json"))
+        self.last_success = {}
+        self.stats = {}
+        self._load()
+
+    def register(self, name: str, candidates: list):
+        self.locators[name] = list(candidates)
+
+    def ordered(self, name: str) -> list:
+        """Candidates in probe order: last successful first, then by registered rank."""
+        candidates = self.locators[name]
+        last = self.last_success.get(name)
+        if last in candidates:
+            return [last] + [c for c in candidates if c != last]
+        return list(candidates)
+
+    def record(self, name: str, selector: str, hit: bool, elapsed_ms: float = 0.0):
+        stats = self.stats.setdefault(name, {}).setdefault(selector, {"hits": 0, "misses": 0, "total_ms": 0.0})
+        stats["hits" if hit else "misses"] += 1
+        stats["total_ms"] += elapsed_ms
+        if hit:
+            if self.last_success.get(name) != selector and selector != self.locators[name][0]:
+                print(f"🧭 '{name}' resolved by fallback selector: {selector}")
+            self.last_success[name] = selector
+
+    def find(self, page, name: str):
+        """Return a Locator for the first candidate visible right now, or None. Never waits."""
+        return self._probe(page, name, self.ordered(name), time.perf_counter())
+
+    async def find_async(self, page, name: str):
+        return await self._probe_async(page, name, self.ordered(name), time.perf_counter())
+
+    def resolve(self, page, name: str, timeout: int = 10000):
+        """Return a Locator for the first visible candidate, waiting at most `timeout` ms in total."""
+        start = time.perf_counter()
+        candidates = self.ordered(name)
+        found = self._probe(page, name, candidates, start)
+        if found is not None:
+            return found
+
+        union = page.locator(candidates[0])
+        for selector in candidates[1:]:
+            union = union.or_(page.locator(selector))
+        try:
+            union.first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            for selector in candidates:
+                self.record(name, selector, hit=False)
+            raise PlaywrightTimeoutError(f"No selector for '{name}' became visible within {timeout} ms: {candidates}")
+
+        found = self._probe(page, name, candidates, start)
+        if found is None:
+            raise PlaywrightTimeoutError(f"'{name}' appeared and vanished before it could be used")
+        return found
+
+    async def resolve_async(self, page, name: str, timeout: int = 10000):
+        """resolve() for playwright.async_api pages."""
+        start = time.perf_counter()
+        candidates = self.ordered(name)
+        found = await self._probe_async(page, name, candidates, start)
+        if found is not None:
+            return found
+
+        union = page.locator(candidates[0])
+        for selector in candidates[1:]:
+            union = union.or_(page.locator(selector))
+        try:
+            await union.first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            for selector in candidates:
+                self.record(name, selector, hit=False)
+            raise PlaywrightTimeoutError(f"No selector for '{name}' became visible within {timeout} ms: {candidates}")
+
+        found = await self._probe_async(page, name, candidates, start)
+        if found is None:
+            raise PlaywrightTimeoutError(f"'{name}' appeared and vanished before it could be used")
+        return found
+
+    async def _probe_async(self, page, name, candidates, start):
+        for selector in candidates:
+            locator = page.locator(selector).first
+            if await locator.is_visible():
+                self._record_hit(name, candidates, selector, start)
+                return locator
+        return None
+
+    def _probe(self, page, name, candidates, start):
+        for selector in candidates:
+            locator = page.locator(selector).first
+            if locator.is_visible():
+                self._record_hit(name, candidates, selector, start)
+                return locator
+        return None
+
+    def _record_hit(self, name, candidates, selector, start):
+        for missed in candidates[:candidates.index(selector)]:
+            self.record(name, missed, hit=False)
+        self.record(name, selector, hit=True, elapsed_ms=(time.perf_counter() - start) * 1000)
+
+    def summary(self) -> list:
+        rows = []
+        for name, selectors in sorted(self.stats.items()):
+            for selector, s in selectors.items():
+                calls = s["hits"] + s["misses"]
+                rows.append({"name": name, "selector": selector, "hits": s["hits"], "misses": s["misses"],
+                             "avg_ms": s["total_ms"] / s["hits"] if s["hits"] else 0.0, "calls": calls})
+        return rows
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"last_success": self.last_success, "stats": self.stats}, f, indent=2, sort_keys=True)
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.last_success = data.get("last_success", {})
+        self.stats = data.get("stats", {})
+
+
+selector_registry = SelectorRegistry()
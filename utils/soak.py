@@ -0,0 +1,253 @@
+"""
+Synthetic monitor: loops the page-object flows for a duration or a number of iterations,
+sampling browser memory and CPU, and recycling the context or browser when it grows too big.
+
+    python -m utils.soak --flows for-you --duration 2h --heap-budget-mb 250
+    python -m utils.soak --flows home,for-you --iterations 500 --output soak.jsonl
+
+Every iteration is one JSON line: latency per flow, cumulative success rate, JS heap,
+DOM nodes, documents and listeners of the long-lived page, and CPU time spent by the
+page and by all browser processes.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from playwright.async_api import async_playwright
+from pages import BASE_URL
+from utils.auth_cache import AuthStateCache
+from utils.flow_runner import FLOWS
+
+MB = 1024 * 1024
+
+
+def parse_duration(value: str) -> float:
+    """'90' / '90s' / '15m' / '2h' -> seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid duration: {value!r}")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
+
+
+async def sample_metrics(session) -> dict:
+    """Performance.getMetrics over the page's CDP session: heap, DOM size and cumulative task time."""
+    metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics"))["metrics"]}
+    return {
+        "js_heap_mb": metrics.get("JSHeapUsedSize", 0) / MB,
+        "js_heap_total_mb": metrics.get("JSHeapTotalSize", 0) / MB,
+        "nodes": int(metrics.get("Nodes", 0)),
+        "documents": int(metrics.get("Documents", 0)),
+        "listeners": int(metrics.get("JSEventListeners", 0)),
+        "task_s": metrics.get("TaskDuration", 0.0),
+    }
+
+
+async def browser_cpu_s(session) -> float:
+    """Cumulative CPU seconds of every browser process (GPU, network, renderers) via SystemInfo."""
+    info = await session.send("SystemInfo.getProcessInfo")
+    return sum(p.get("cpuTime", 0.0) for p in info["processInfo"])
+
+
+class SoakRunner:
+    """
+    Runs the flows back to back on one long-lived page per context, so whatever the flows leak
+    stays in that page's heap and DOM and shows up in the samples.
+    The context (and its page) is recycled when the heap exceeds heap_budget_mb (or after
+    context_max_iterations); the browser is relaunched when a fresh context is already
+    over budget or the browser crashed.
+    """
+
+    def __init__(self, playwright, flows: list, base_url: str = BASE_URL, credentials=(None, None),
+                 storage_state: str = None, heap_budget_mb: float = 300, context_max_iterations: int = 0,
+                 headless: bool = True):
+        self.playwright = playwright
+        self.flows = flows
+        self.base_url = base_url
+        self.credentials = credentials
+        self.storage_state = storage_state
+        self.heap_budget_mb = heap_budget_mb
+        self.context_max_iterations = context_max_iterations
+        self.headless = headless
+        self.browser = None
+        self.browser_session = None
+        self.context = None
+        self.page = None
+        self.session = None
+        self.browser_generation = 0
+        self.context_generation = 0
+        self.context_iterations = 0
+        self.runs = 0
+        self.successes = 0
+
+    async def _new_browser(self):
+        if self.browser:
+            await self.browser.close()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.browser_session = await self.browser.new_browser_cdp_session()
+        self.browser_generation += 1
+        self.context = None
+
+    async def _new_context(self):
+        if self.context:
+            await self.context.close()
+        self.context = await self.browser.new_context(storage_state=self.storage_state)
+        self.context_generation += 1
+        self.context_iterations = 0
+        await self._new_page()
+
+    async def _new_page(self):
+        self.page = await self.context.new_page()
+        self.session = await self.context.new_cdp_session(self.page)
+        await self.session.send("Performance.enable")
+
+    async def iteration(self, number: int) -> dict:
+        if self.browser is None or not self.browser.is_connected():
+            await self._new_browser()
+        if self.context is None:
+            await self._new_context()
+
+        row = {"iteration": number, "ts": time.time(), "browser": self.browser_generation,
+               "context": self.context_generation, "flows": {}, "ok": True}
+        start = time.perf_counter()
+        try:
+            if self.page.is_closed():
+                # The renderer crashed; keep the context, start over on a new page
+                await self._new_page()
+            task_before = (await sample_metrics(self.session))["task_s"]
+            browser_cpu_before = await browser_cpu_s(self.browser_session)
+            for name in self.flows:
+                flow_start = time.perf_counter()
+                try:
+                    await FLOWS[name](self.page, self.base_url, self.credentials)
+                    row["flows"][name] = {"ok": True, "ms": (time.perf_counter() - flow_start) * 1000}
+                except Exception as e:
+                    row["ok"] = False
+                    row["flows"][name] = {"ok": False, "ms": (time.perf_counter() - flow_start) * 1000,
+                                          "error": str(e).splitlines()[0] if str(e) else type(e).__name__}
+                    break
+            row["latency_ms"] = (time.perf_counter() - start) * 1000
+            metrics = await sample_metrics(self.session)
+            metrics["cpu_ms"] = (metrics.pop("task_s") - task_before) * 1000
+            metrics["browser_cpu_ms"] = (await browser_cpu_s(self.browser_session) - browser_cpu_before) * 1000
+            row.update(metrics)
+        except Exception as e:
+            # The page or the whole browser went away mid-iteration
+            row.update(ok=False, error=str(e).splitlines()[0] if str(e) else type(e).__name__,
+                       latency_ms=(time.perf_counter() - start) * 1000)
+
+        self.runs += 1
+        self.successes += int(row["ok"])
+        self.context_iterations += 1
+        row["success_rate"] = self.successes / self.runs
+        row["recycled"] = await self._recycle(row)
+        return row
+
+    async def _recycle(self, row: dict):
+        if not self.browser.is_connected():
+            await self._new_browser()
+            return "browser crashed"
+        heap = row.get("js_heap_mb")
+        if heap is not None and heap > self.heap_budget_mb:
+            if self.context_iterations == 1:
+                # Even a fresh context is over budget: the browser itself is bloated
+                await self._new_browser()
+                return f"browser over budget ({heap:.0f} MB)"
+            await self._new_context()
+            return f"context over budget ({heap:.0f} MB)"
+        if self.context_max_iterations and self.context_iterations >= self.context_max_iterations:
+            await self._new_context()
+            return "context max iterations"
+        return None
+
+    async def close(self):
+        if self.browser:
+            await self.browser.close()
+
+
+async def soak(runner: SoakRunner, duration_s: float = None, iterations: int = None, output: str = None) -> list:
+    """Loop runner.iteration() until the duration or iteration count runs out; rows are also appended to output."""
+    deadline = time.monotonic() + duration_s if duration_s else None
+    rows = []
+    out = open(output, "a") if output else None
+    try:
+        number = 0
+        while (iterations is None or number < iterations) and (deadline is None or time.monotonic() < deadline):
+            number += 1
+            row = await runner.iteration(number)
+            rows.append(row)
+            if out:
+                out.write(json.dumps(row) + "\n")
+                out.flush()
+            status = "✅" if row["ok"] else "❌"
+            print(f"{status} #{number}: {row['latency_ms']:.0f} ms, success {row['success_rate']:.1%}, "
+                  f"heap {row.get('js_heap_mb', float('nan')):.0f} MB, nodes {row.get('nodes', '-')}"
+                  + (f", recycled: {row['recycled']}" if row["recycled"] else ""))
+    finally:
+        if out:
+            out.close()
+    return rows
+
+
+def summarize(rows: list) -> dict:
+    ok = sorted(r["latency_ms"] for r in rows if r["ok"])
+    heaps = [r["js_heap_mb"] for r in rows if "js_heap_mb" in r]
+    return {
+        "iterations": len(rows),
+        "success_rate": sum(r["ok"] for r in rows) / len(rows) if rows else 0.0,
+        "p50_ms": ok[len(ok) // 2] if ok else None,
+        "p95_ms": ok[min(len(ok) - 1, int(len(ok) * 0.95))] if ok else None,
+        "max_heap_mb": max(heaps, default=None),
+        "recycles": sum(1 for r in rows if r["recycled"]),
+    }
+
+
+async def main_async(args) -> int:
+    username, password = os.getenv("SIRIUSXM_USERNAME"), os.getenv("SIRIUSXM_PASSWORD")
+    state_path = AuthStateCache().state_path(username) if username else None
+    output = args.output or os.path.join(".cache", f"soak-{time.strftime('%Y%m%dT%H%M%S')}.jsonl")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    async with async_playwright() as p:
+        runner = SoakRunner(
+            p, args.flows.split(","), args.base_url, (username, password),
+            storage_state=state_path if state_path and os.path.exists(state_path) else None,
+            heap_budget_mb=args.heap_budget_mb, context_max_iterations=args.context_max_iterations,
+            headless=not args.headed,
+        )
+        try:
+            rows = await soak(runner, args.duration, args.iterations, output)
+        finally:
+            await runner.close()
+
+    print(summarize(rows))
+    print(f"Time series written to: {output}")
+    return 0 if rows and all(r["ok"] for r in rows) else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flows", default="for-you", help=f"Comma-separated, run in order: {', '.join(FLOWS)}")
+    parser.add_argument("--duration", type=parse_duration, help="How long to loop, e.g. 90s, 30m, 4h")
+    parser.add_argument("--iterations", type=int, help="Stop after this many iterations")
+    parser.add_argument("--heap-budget-mb", type=float, default=float(os.getenv("PW_SOAK_HEAP_MB", "300")))
+    parser.add_argument("--context-max-iterations", type=int, default=0, help="Also recycle after N iterations (0 = never)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--output", help="JSON-lines time series (default: .cache/soak-<timestamp>.jsonl)")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    unknown = set(args.flows.split(",")) - set(FLOWS)
+    if unknown:
+        parser.error(f"Unknown flow(s): {', '.join(sorted(unknown))}")
+    if args.duration is None and args.iterations is None:
+        parser.error("Pass --duration and/or --iterations")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    if os.getenv("CI") != "true":
+        from dotenv import load_dotenv
+        load_dotenv()
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import os
+import time
+from urllib.parse import urlsplit
+from playwright.sync_api import Page
+from utils.trace_window import trace_window
+
+# Every step run this session, for the terminal summary
+step_reports = []
+
+
+class StepRunner:
+    """
+    Runs a test as named steps. After each successful step the page URL and storage
+    state are checkpointed; a failed step is retried with exponential backoff after
+    restoring the last good checkpoint, so a late flake costs one step, not the whole flow.
+    """
+
+    def __init__(self, page: Page, retries: int = None, backoff_ms: int = 500, backoff_factor: float = 2.0):
+        self.page = page
+        self.retries = retries if retries is not None else int(os.getenv("PW_STEP_RETRIES", "1"))
+        self.backoff_ms = backoff_ms
+        self.backoff_factor = backoff_factor
+        self.reports = []
+        self._checkpoint = None
+        self.checkpoint()
+
+    def run(self, name: str, fn, retries: int = None, resume=None):
+        """
+        Run fn() as step `name`, retrying up to `retries` times from the last checkpoint.
+        restore() reloads the page, so transient state such as playback is gone on a retry;
+        resume() is called before each retry to bring it back (e.g. click Play again).
+        """
+        retries = self.retries if retries is None else retries
+        attempts = 0
+        retry_cost_ms = 0.0
+        start = time.perf_counter()
+
+        while True:
+            attempts += 1
+            attempt_start = time.perf_counter()
+            trace_window.mark(self.page, f"step {name} #{attempts}")
+            try:
+                if resume and attempts > 1:
+                    resume()
+                result = fn()
+                break
+            except Exception as e:
+                retry_cost_ms += (time.perf_counter() - attempt_start) * 1000
+                if attempts > retries:
+                    self._report(name, attempts, start, retry_cost_ms, ok=False)
+                    raise
+                delay = self.backoff_ms * self.backoff_factor ** (attempts - 1)
+                print(f"🔁 Step '{name}' failed ({type(e).__name__}: {e}). "
+                      f"Retrying in {delay:.0f} ms from checkpoint {self._checkpoint['url']}")
+                restore_start = time.perf_counter()
+                self.page.wait_for_timeout(delay)
+                self.restore()
+                retry_cost_ms += (time.perf_counter() - restore_start) * 1000
+
+        self.checkpoint()
+        self._report(name, attempts, start, retry_cost_ms, ok=True)
+        return result
+
+    def checkpoint(self):
+        self._checkpoint = {"url": self.page.url, "storage_state": self.page.context.storage_state()}
+
+    def restore(self):
+        """
+        Put the page back on the last good URL with the cookies and localStorage it had.
+        localStorage is written first, on a blank stand-in page of each origin, so the app
+        boots on the checkpoint's values instead of the failed attempt's.
+        """
+        state = self._checkpoint["storage_state"]
+        context = self.page.context
+        context.clear_cookies()
+        if state["cookies"]:
+            context.add_cookies(state["cookies"])
+        url = self._checkpoint["url"]
+        if url.startswith("http"):
+            parts = urlsplit(url)
+            storage = {f"{parts.scheme}://{parts.netloc}": []}
+            storage.update({o["origin"]: o["localStorage"] for o in state.get("origins", [])})
+            for origin, items in storage.items():
+                self._seed_local_storage(origin, items)
+            self.page.goto(url)
+
+    def _seed_local_storage(self, origin: str, items: list):
+        blank = f"{origin}/__step_runner_restore__"
+        self.page.route(blank, lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        try:
+            self.page.goto(blank)
+            self.page.evaluate(
+                "items => { localStorage.clear(); items.forEach(i => localStorage.setItem(i.name, i.value)); }",
+                items,
+            )
+        finally:
+            self.page.unroute(blank)
+
+    def _report(self, name, attempts, start, retry_cost_ms, ok):
+        report = {
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0],
+            "step": name,
+            "ok": ok,
+            "attempts": attempts,
+            "ms": (time.perf_counter() - start) * 1000,
+            "retry_cost_ms": retry_cost_ms,
+        }
+        self.reports.append(report)
+        step_reports.append(report)
+        status = "✅" if ok else "❌"
+        extra = f", {attempts - 1} retr{'y' if attempts == 2 else 'ies'} cost {retry_cost_ms:.0f} ms" if attempts > 1 else ""
+        print(f"{status} Step '{name}' finished in {report['ms']:.0f} ms{extra}")
@@ -0,0 +1,180 @@
+import functools
+import inspect
+import os
+import re
+import shutil
+import tempfile
+import time
+import weakref
+from collections import deque
+
+
+def _safe(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_")
+
+
+class _Ring:
+    """The last `size` trace chunks of one context, as zips in a scratch directory."""
+
+    def __init__(self, size: int, label: str):
+        self.dir = tempfile.mkdtemp(prefix="pw-trace-window-")
+        self.chunks = deque()
+        self.size = size
+        self.label = label
+        self.count = 0
+        self.depth = 0  # page-object calls in progress; only the outermost one cuts a chunk
+
+    def next_path(self) -> str:
+        self.count += 1
+        return os.path.join(self.dir, f"{self.count:04d}.zip")
+
+    def push(self, path: str):
+        self.chunks.append((self.label, path))
+        while len(self.chunks) > self.size:
+            _, evicted = self.chunks.popleft()
+            os.remove(evicted)
+
+
+class TraceWindow:
+    """
+    Failure-only Playwright tracing. Tracing runs in chunks cut at every test step and every
+    top-level page-object call (calls made from inside another page-object method stay in
+    their caller's chunk); only the last `size` chunks are kept, and they are copied out only
+    when the test fails. Disabled by default; when disabled mark() is a no-op.
+    Cutting a chunk serialises it to a zip even on passing tests, so every mark is timed and
+    the count and cost are reported in the session summary (see stats()).
+    """
+
+    def __init__(self, size: int = 5, out_dir: str = None):
+        self.size = size
+        self.out_dir = out_dir or os.getenv("PW_TRACE_DIR", os.path.join(os.getcwd(), "traces"))
+        self.enabled = False
+        self._rings = weakref.WeakKeyDictionary()
+        self._instrumented = []
+        self.marks = 0
+        self.mark_ms = 0.0
+        self.max_mark_ms = 0.0
+
+    def enable(self, *classes, size: int = None):
+        self.enabled = True
+        self.size = size or self.size
+        for cls in classes:
+            self.instrument(cls)
+
+    def disable(self):
+        for cls, name, original in self._instrumented:
+            setattr(cls, name, original)
+        self._instrumented.clear()
+        self.enabled = False
+
+    def instrument(self, cls):
+        """Start a new chunk at every public method defined on cls, named Class.method."""
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", member))
+            self._instrumented.append((cls, name, member))
+
+    def _wrap(self, label, fn):
+        window = self
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(po, *args, **kwargs):
+                ring = window._ring(getattr(po, "page", None))
+                if ring is None:
+                    return await fn(po, *args, **kwargs)
+                if ring.depth == 0:
+                    await window.mark_async(po.page, label)
+                ring.depth += 1
+                try:
+                    return await fn(po, *args, **kwargs)
+                finally:
+                    ring.depth -= 1
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(po, *args, **kwargs):
+            ring = window._ring(getattr(po, "page", None))
+            if ring is None:
+                return fn(po, *args, **kwargs)
+            if ring.depth == 0:
+                window.mark(po.page, label)
+            ring.depth += 1
+            try:
+                return fn(po, *args, **kwargs)
+            finally:
+                ring.depth -= 1
+        return wrapper
+
+    def _ring(self, page):
+        return self._rings.get(page.context) if self.enabled and page is not None else None
+
+    def _timed(self, start: float):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.marks += 1
+        self.mark_ms += elapsed_ms
+        self.max_mark_ms = max(self.max_mark_ms, elapsed_ms)
+
+    def stats(self) -> dict:
+        return {"marks": self.marks, "avg_ms": self.mark_ms / self.marks if self.marks else 0.0,
+                "max_ms": self.max_mark_ms, "total_ms": self.mark_ms}
+
+    def start(self, context, label: str = "start"):
+        if not self.enabled or context in self._rings:
+            return
+        context.tracing.start(snapshots=True, screenshots=True)
+        context.tracing.start_chunk(title=label)
+        self._rings[context] = _Ring(self.size, label)
+
+    def mark(self, page, label: str):
+        """Close the running chunk into the window and start a new one named label."""
+        ring = self._ring(page)
+        if ring is None:
+            return
+        start = time.perf_counter()
+        path = ring.next_path()
+        page.context.tracing.stop_chunk(path=path)
+        ring.push(path)
+        ring.label = label
+        page.context.tracing.start_chunk(title=label)
+        self._timed(start)
+
+    async def mark_async(self, page, label: str):
+        ring = self._ring(page)
+        if ring is None:
+            return
+        start = time.perf_counter()
+        path = ring.next_path()
+        await page.context.tracing.stop_chunk(path=path)
+        ring.push(path)
+        ring.label = label
+        await page.context.tracing.start_chunk(title=label)
+        self._timed(start)
+
+    def finish(self, context, failed: bool, name: str) -> list:
+        """
+        Stop tracing on a context. On failure the window (including the chunk that failed)
+        is copied to out_dir/<name>/ and the paths are returned; otherwise it is dropped.
+        """
+        ring = self._rings.pop(context, None)
+        if ring is None:
+            return []
+        saved = []
+        try:
+            if failed:
+                path = ring.next_path()
+                context.tracing.stop_chunk(path=path)
+                ring.push(path)
+                target = os.path.join(self.out_dir, _safe(name))
+                os.makedirs(target, exist_ok=True)
+                for i, (label, chunk) in enumerate(ring.chunks, 1):
+                    saved.append(shutil.copy(chunk, os.path.join(target, f"{i:02d}-{_safe(label)}.zip")))
+            else:
+                context.tracing.stop_chunk()
+            context.tracing.stop()
+        finally:
+            shutil.rmtree(ring.dir, ignore_errors=True)
+        return saved
+
+
+trace_window = TraceWindow()
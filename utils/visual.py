@@ -0,0 +1,131 @@
+"""
+Visual checks against stored baselines, diffed as NumPy arrays (numpy and Pillow are in requirements.txt).
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import numpy as np
+from PIL import Image
+from utils.artifacts import artifacts
+
+BASELINE_DIR = os.getenv("PW_VISUAL_BASELINES", os.path.join(os.getcwd(), "visual_baselines"))
+
+
+def decode(data: bytes):
+    """PNG/JPEG bytes -> HxWx3 uint8 array."""
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+def diff(current, baseline, tolerance: int = 16, masks=()) -> dict:
+    """
+    Pixels whose largest per-channel difference exceeds tolerance, ignoring masks
+    (x, y, width, height rectangles in CSS pixels of the screenshot). Fully vectorised.
+    """
+    if current.shape != baseline.shape:
+        return {"same_size": False, "changed": None, "ratio": 1.0, "bbox": None, "changed_mask": None}
+    changed = np.abs(current.astype(np.int16) - baseline.astype(np.int16)).max(axis=2) > tolerance
+    for x, y, width, height in masks:
+        changed[max(0, int(y)):max(0, int(y + height)), max(0, int(x)):max(0, int(x + width))] = False
+    count = int(np.count_nonzero(changed))
+    bbox = None
+    if count:
+        rows, cols = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+        bbox = (int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1))
+    return {"same_size": True, "changed": count, "ratio": count / changed.size, "bbox": bbox, "changed_mask": changed}
+
+
+def highlight(current, changed_mask) -> bytes:
+    """The current frame with changed pixels painted red, encoded like the other artifacts."""
+    overlay = (current * 0.4).astype(np.uint8)
+    overlay[changed_mask] = (255, 0, 0)
+    out = io.BytesIO()
+    Image.fromarray(overlay).save(out, format="JPEG" if artifacts.image_type == "jpeg" else "PNG")
+    return out.getvalue()
+
+
+class VisualBaselines:
+    """
+    Baseline screenshots plus an index of their sha1. A frame that is byte-identical to its
+    baseline is accepted without decoding anything; every other frame gets the full diff.
+    Missing baselines are recorded on first use; PW_VISUAL_UPDATE=true re-records all of them.
+    """
+
+    def __init__(self, root: str = BASELINE_DIR, update: bool = None):
+        self.root = root
+        self.update = update if update is not None else os.getenv("PW_VISUAL_UPDATE") == "true"
+        self.index_path = os.path.join(root, "index.json")
+        self.stats = {"identical": 0, "diffed": 0, "failed": 0, "recorded": 0}
+        self._lock = threading.Lock()
+        self._index = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = f"{self.index_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+    def record(self, name: str, data: bytes, pixels=None):
+        pixels = decode(data) if pixels is None else pixels
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, f"{name}.png")
+        Image.fromarray(pixels).save(path, format="PNG")
+        with self._lock:
+            self._index[name] = {
+                "file": os.path.basename(path),
+                "sha1": hashlib.sha1(data).hexdigest(),
+                "size": [int(pixels.shape[1]), int(pixels.shape[0])],
+            }
+            self._save()
+        self.stats["recorded"] += 1
+
+    def check(self, name: str, data: bytes, tolerance: int = 16, max_diff_ratio: float = 0.001,
+              masks=()) -> dict:
+        """Compare screenshot bytes with the baseline `name`; returns the result (see result["ok"])."""
+        entry = self._index.get(name)
+        if entry is None or self.update:
+            self.record(name, data)
+            return {"name": name, "ok": True, "how": "recorded"}
+        if hashlib.sha1(data).hexdigest() == entry["sha1"]:
+            self.stats["identical"] += 1
+            return {"name": name, "ok": True, "how": "identical"}
+
+        pixels = decode(data)
+        self.stats["diffed"] += 1
+        with open(os.path.join(self.root, entry["file"]), "rb") as f:
+            baseline = decode(f.read())
+        result = diff(pixels, baseline, tolerance, masks)
+        ok = result["same_size"] and result["ratio"] <= max_diff_ratio
+        report = {"name": name, "ok": ok, "how": "diff", "ratio": result["ratio"], "bbox": result["bbox"],
+                  "same_size": result["same_size"], "diff_path": None}
+        if not ok:
+            self.stats["failed"] += 1
+            if result["changed_mask"] is not None:
+                report["diff_path"] = artifacts.submit(highlight(pixels, result["changed_mask"]), f"{name}_diff")
+        return report
+
+
+def check_page(page, name: str, baselines: VisualBaselines = None, mask=(), regions=(),
+               full_page: bool = False, **kwargs) -> dict:
+    """
+    Screenshot a sync page and check it against baseline `name`. mask takes Locators that
+    Playwright paints over (dynamic content); regions takes extra (x, y, w, h) rectangles.
+    """
+    data = page.screenshot(type="png", full_page=full_page, mask=list(mask), animations="disabled", caret="hide")
+    result = (baselines or visual_baselines).check(name, data, masks=regions, **kwargs)
+    status = "✅" if result["ok"] else "❌"
+    print(f"{status} Visual check '{name}': {result['how']}"
+          + (f", {result['ratio']:.3%} changed in {result['bbox']}" if result["how"] == "diff" else ""))
+    return result
+
+
+visual_baselines = VisualBaselines()
@@ -0,0 +1,187 @@
+import math
+import time
+import weakref
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# Requests that never "finish" on a music player; they must not block a settle
+IGNORED_RESOURCE_TYPES = {"media", "websocket", "eventsource", "ping"}
+
+# Records the time of the last DOM mutation. Installed as an init script by watch_dom() so
+# the observer exists before any action runs; a document without it starts out "quiet".
+_DOM_OBSERVER = """if (!window.__pwSettle) {
+        window.__pwSettle = {last: 0};
+        new MutationObserver(() => { window.__pwSettle.last = performance.now(); })
+            .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    }"""
+
+DOM_OBSERVER_JS = f"""(() => {{
+    {_DOM_OBSERVER}
+}})()"""
+
+# Polled in the page by wait_for_function, so waiting for a quiet DOM costs one round trip
+DOM_QUIET_JS = f"""quietMs => {{
+    {_DOM_OBSERVER}
+    return performance.now() - window.__pwSettle.last >= quietMs;
+}}"""
+
+
+class NetworkTracker:
+    """Counts in-flight requests for a page from Playwright's network events."""
+
+    def __init__(self, page: Page, max_request_age: float = 2.0):
+        self.max_request_age = max_request_age
+        self.inflight = {}
+        self.last_activity = time.monotonic()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _on_request(self, request):
+        if request.resource_type in IGNORED_RESOURCE_TYPES:
+            return
+        self.inflight[request] = time.monotonic()
+        self.last_activity = time.monotonic()
+
+    def _on_done(self, request):
+        if self.inflight.pop(request, None) is not None:
+            self.last_activity = time.monotonic()
+
+    def quiet_for(self) -> float:
+        """Seconds since the last network activity, or 0 while a short-lived request is pending."""
+        now = time.monotonic()
+        # Long-polling or streaming calls would otherwise hold the page "busy" forever
+        pending = [t for t in self.inflight.values() if now - t < self.max_request_age]
+        if pending:
+            return 0.0
+        return now - self.last_activity
+
+
+class WaitStats:
+    """Records how long every settle() actually took, so fixed sleeps can be tuned away."""
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, label: str, elapsed_ms: float, timed_out: bool):
+        self.records.append((label, elapsed_ms, timed_out))
+
+    def summary(self) -> list:
+        rows = {}
+        for label, elapsed_ms, timed_out in self.records:
+            row = rows.setdefault(label, {"label": label, "count": 0, "total_ms": 0.0, "max_ms": 0.0, "timeouts": 0})
+            row["count"] += 1
+            row["total_ms"] += elapsed_ms
+            row["max_ms"] = max(row["max_ms"], elapsed_ms)
+            row["timeouts"] += int(timed_out)
+        return sorted(rows.values(), key=lambda r: r["total_ms"], reverse=True)
+
+    def clear(self):
+        self.records.clear()
+
+
+wait_stats = WaitStats()
+_trackers = weakref.WeakKeyDictionary()
+_watched = weakref.WeakSet()
+
+
+def track_network(page: Page) -> NetworkTracker:
+    """Attach (once) and return the network tracker for a page."""
+    tracker = _trackers.get(page)
+    if tracker is None:
+        tracker = _trackers[page] = NetworkTracker(page)
+    return tracker
+
+
+def watch_dom(page: Page):
+    """Observe DOM mutations on this page from the start of every document it loads."""
+    if page not in _watched:
+        _watched.add(page)
+        page.add_init_script(DOM_OBSERVER_JS)
+        page.evaluate(DOM_OBSERVER_JS)
+
+
+async def watch_dom_async(page):
+    """watch_dom() for playwright.async_api pages."""
+    if page not in _watched:
+        _watched.add(page)
+        await page.add_init_script(DOM_OBSERVER_JS)
+        await page.evaluate(DOM_OBSERVER_JS)
+
+
+def _settle_calls(tracker, quiet_ms, timeout, deadline, url, predicate, predicate_arg, dom, poll_ms):
+    """
+    The page calls a settle needs, as (method, kwargs); settle() and settle_async() only run them.
+    Network quiet is tracked from Playwright events on our side, so it needs no calls at all.
+    """
+    def remaining_ms():
+        return max(1, (deadline - time.monotonic()) * 1000)
+
+    if url is not None:
+        yield "wait_for_url", {"url": url, "timeout": remaining_ms()}
+    if predicate is not None:
+        yield "wait_for_function", {"expression": predicate, "arg": predicate_arg, "timeout": remaining_ms()}
+
+    while True:
+        if dom:
+            yield "wait_for_function", {"expression": DOM_QUIET_JS, "arg": quiet_ms, "polling": poll_ms,
+                                        "timeout": remaining_ms()}
+        net_quiet_ms = tracker.quiet_for() * 1000 if tracker else math.inf
+        if net_quiet_ms >= quiet_ms:
+            return
+        if time.monotonic() >= deadline:
+            raise PlaywrightTimeoutError(f"Page did not settle within {timeout} ms")
+        # Sleep until the network could be quiet, then re-check the DOM (instant if still quiet)
+        yield "wait_for_timeout", {"timeout": min(max(quiet_ms - net_quiet_ms, poll_ms), remaining_ms())}
+
+
+def _finish(label: str, start: float, timed_out: bool) -> float:
+    elapsed_ms = (time.monotonic() - start) * 1000
+    wait_stats.add(label, elapsed_ms, timed_out)
+    status = "timed out" if timed_out else "settled"
+    print(f"⏱️ {label} {status} after {elapsed_ms:.0f} ms")
+    return elapsed_ms
+
+
+def settle(page: Page, label: str = "settle", quiet_ms: int = 300, timeout: int = 5000,
+           url=None, predicate: str = None, predicate_arg=None,
+           dom: bool = True, network: bool = True, poll_ms: int = 50,
+           raise_on_timeout: bool = False) -> float:
+    """
+    Wait until the page is actually ready instead of sleeping a fixed time.
+    Resolves once the optional url / JS predicate holds and both the DOM and the network
+    have been quiet for quiet_ms, or when timeout (ms) runs out. Returns the elapsed ms.
+    The DOM check is polled inside the page (every poll_ms), not over the wire.
+    """
+    start = time.monotonic()
+    tracker = track_network(page) if network else None
+    timed_out = False
+    try:
+        for method, kwargs in _settle_calls(tracker, quiet_ms, timeout, start + timeout / 1000,
+                                            url, predicate, predicate_arg, dom, poll_ms):
+            getattr(page, method)(**kwargs)
+    except PlaywrightTimeoutError:
+        timed_out = True
+        if raise_on_timeout:
+            _finish(label, start, timed_out)
+            raise
+    return _finish(label, start, timed_out)
+
+
+async def settle_async(page, label: str = "settle", quiet_ms: int = 300, timeout: int = 5000,
+                       url=None, predicate: str = None, predicate_arg=None,
+                       dom: bool = True, network: bool = True, poll_ms: int = 50,
+                       raise_on_timeout: bool = False) -> float:
+    """settle() for playwright.async_api pages; same arguments and stats."""
+    start = time.monotonic()
+    tracker = track_network(page) if network else None
+    timed_out = False
+    try:
+        for method, kwargs in _settle_calls(tracker, quiet_ms, timeout, start + timeout / 1000,
+                                            url, predicate, predicate_arg, dom, poll_ms):
+            await getattr(page, method)(**kwargs)
+    except PlaywrightTimeoutError:
+        timed_out = True
+        if raise_on_timeout:
+            _finish(label, start, timed_out)
+            raise
+    return _finish(label, start, timed_out)
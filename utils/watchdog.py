@@ -0,0 +1,119 @@
+import time
+import weakref
+from playwright.sync_api import BrowserContext, Locator, Page
+from pages.locators import LOCATORS
+
+
+class OverlayHandler:
+    """
+    One interrupting element: how to find it on a page and how to get rid of it.
+    locator(page) returns the Locator to watch; action(locator) dismisses it (defaults to a click).
+    """
+
+    def __init__(self, name: str, locator, action=None, times: int = None, no_wait_after: bool = False):
+        self.name = name
+        self.locator = locator
+        self.action = action or (lambda target: target.first.click(timeout=5000))
+        self.times = times
+        self.no_wait_after = no_wait_after
+        self.fires = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def _run(self, target: Locator):
+        start = time.perf_counter()
+        try:
+            self.action(target)
+        except Exception as e:
+            # Raising here would fail whatever action the test was about to perform
+            self.errors += 1
+            print(f"⚠️ Overlay handler '{self.name}' failed: {e}")
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.fires += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            print(f"🧹 Dismissed {self.name} in {elapsed_ms:.0f} ms")
+
+
+class OverlayWatchdog:
+    """
+    Registers page.add_locator_handler for known overlays, so they are dismissed only when
+    they actually block an action instead of being polled for after every click.
+    Handlers run right before Playwright acts on or asserts against another element.
+    """
+
+    def __init__(self, handlers=()):
+        self.handlers = list(handlers)
+        self._contexts = weakref.WeakSet()
+        self._pages = weakref.WeakSet()
+
+    def register(self, handler: OverlayHandler):
+        self.handlers.append(handler)
+
+    def handler(self, name: str) -> OverlayHandler:
+        return next(h for h in self.handlers if h.name == name)
+
+    def fires(self, name: str) -> int:
+        return self.handler(name).fires
+
+    def install(self, context: BrowserContext):
+        """Watch every current and future page of a context; safe to call once per test on pooled contexts."""
+        if context not in self._contexts:
+            self._contexts.add(context)
+            context.on("page", self.attach)
+        for page in context.pages:
+            self.attach(page)
+
+    def uninstall(self, context: BrowserContext):
+        """Stop watching new pages of a context; its current pages keep their handlers until closed."""
+        if context in self._contexts:
+            self._contexts.discard(context)
+            context.remove_listener("page", self.attach)
+
+    def attach(self, page: Page):
+        if page in self._pages:
+            return
+        self._pages.add(page)
+        for h in self.handlers:
+            page.add_locator_handler(h.locator(page), h._run, no_wait_after=h.no_wait_after, times=h.times)
+
+    def watching(self, page: Page) -> bool:
+        return page in self._pages
+
+    def summary(self) -> list:
+        return [
+            {"name": h.name, "fires": h.fires, "errors": h.errors, "total_ms": h.total_ms, "max_ms": h.max_ms,
+             "avg_ms": h.total_ms / h.fires if h.fires else 0.0}
+            for h in self.handlers
+        ]
+
+
+def _cookie_banner(page: Page) -> Locator:
+    locator = page.locator(LOCATORS["login.cookie_accept"][0])
+    for selector in LOCATORS["login.cookie_accept"][1:]:
+        locator = locator.or_(page.locator(selector))
+    return locator
+
+
+def _playback_stalled(page: Page) -> Locator:
+    # The auth-method modal shares this container, so only the "Try again" button is watched
+    return page.locator('[data-qa="content-overlay-modal"]').locator("button", has_text="Try again")
+
+
+def _close_overlay(page: Page) -> Locator:
+    # Only on player pages (those with a Play/Pause control), so the login modal's close button is never touched
+    return page.locator('body:has(button[aria-label^="Play"], button[aria-label^="Pause"]) '
+                        'button[data-qa="close-overlay"]')
+
+
+def default_handlers() -> list:
+    return [
+        OverlayHandler("cookie banner", _cookie_banner),
+        OverlayHandler("playback stalled", _playback_stalled),
+        OverlayHandler("overlay", _close_overlay),
+    ]
+
+
+watchdog = OverlayWatchdog(default_handlers())
@@ -0,0 +1,239 @@
+"""
+Navigation timing and Web Vitals for every page-object navigation, kept in SQLite per commit and run.
+
+    pytest --vitals                          # record (or PW_VITALS=true)
+    python -m utils.web_vitals report        # compare the latest run against the previous ones
+
+The report flags a metric when the latest run is slower than the rolling baseline both by
+more than --min-change and by a Welch t statistic above --t (exit code 1 when any is flagged).
+"""
+import argparse
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+import weakref
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from utils.waits import settle, settle_async
+
+DB_PATH = os.getenv("PW_VITALS_DB", os.path.join(os.getcwd(), ".cache", "vitals.sqlite"))
+
+# Lower is better for every metric; None values (soft navigations have no paint timing) are skipped
+METRICS = ["ttfb_ms", "fcp_ms", "lcp_ms", "dcl_ms", "load_ms", "duration_ms", "cls", "resources", "transfer_bytes"]
+
+VITALS_INIT_JS = """(() => {
+    if (window.__pwVitals) return;
+    const v = window.__pwVitals = {lcp: null, shifts: []};
+    try {
+        new PerformanceObserver(list => {
+            for (const e of list.getEntries()) v.lcp = e.renderTime || e.loadTime || e.startTime;
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+        new PerformanceObserver(list => {
+            for (const e of list.getEntries()) if (!e.hadRecentInput) v.shifts.push({t: e.startTime, value: e.value});
+        }).observe({type: 'layout-shift', buffered: true});
+    } catch (e) {}
+})()"""
+
+MARK_JS = "() => ({since: performance.now(), origin: performance.timeOrigin})"
+
+# A changed timeOrigin means a new document (hard navigation); otherwise only what happened
+# after the mark counts, since client-side navigations keep the old document's timings.
+COLLECT_JS = """({since, origin}) => {
+    const v = window.__pwVitals || {lcp: null, shifts: []};
+    const hard = performance.timeOrigin !== origin;
+    const from = hard ? 0 : since;
+    const nav = hard ? performance.getEntriesByType('navigation')[0] : null;
+    const fcp = hard ? performance.getEntriesByType('paint').find(p => p.name === 'first-contentful-paint') : null;
+    const resources = performance.getEntriesByType('resource').filter(r => r.startTime >= from);
+    return {
+        url: location.href,
+        kind: hard ? 'hard' : 'soft',
+        ttfb_ms: nav ? nav.responseStart : null,
+        fcp_ms: fcp ? fcp.startTime : null,
+        lcp_ms: hard ? v.lcp : null,
+        dcl_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+        cls: v.shifts.filter(s => s.t >= from).reduce((sum, s) => sum + s.value, 0),
+        resources: resources.length,
+        transfer_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    };
+}"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS navigations (
+    run_id TEXT, commit_sha TEXT, recorded_at REAL, label TEXT, url TEXT, kind TEXT,
+    ttfb_ms REAL, fcp_ms REAL, lcp_ms REAL, dcl_ms REAL, load_ms REAL, duration_ms REAL,
+    cls REAL, resources INTEGER, transfer_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS navigations_run ON navigations (run_id, recorded_at);
+"""
+
+
+def current_commit() -> str:
+    sha = os.getenv("PW_COMMIT") or os.getenv("GITHUB_SHA")
+    if sha:
+        return sha
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def connect(path: str = DB_PATH) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+class VitalsRecorder:
+    """
+    Collects one sample per page-object navigation. Disabled by default; when disabled
+    navigation() is a no-op and costs no round trips.
+    """
+
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        self.enabled = False
+        self.run_id = None
+        self.commit = None
+        self.samples = []
+        self._pages = weakref.WeakSet()
+
+    def enable(self, run_id: str = None, commit: str = None):
+        self.enabled = True
+        self.run_id = run_id or f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.commit = commit or current_commit()
+
+    def navigation(self, page, label: str):
+        """Context manager around the action that navigates; records one sample when it finishes."""
+        if not self.enabled:
+            return nullcontext()
+        return self._navigation(page, label)
+
+    def navigation_async(self, page, label: str):
+        if not self.enabled:
+            return nullcontext()
+        return self._navigation_async(page, label)
+
+    @contextmanager
+    def _navigation(self, page, label):
+        if page not in self._pages:
+            self._pages.add(page)
+            page.add_init_script(VITALS_INIT_JS)
+        page.evaluate(VITALS_INIT_JS)
+        mark = page.evaluate(MARK_JS)
+        start = time.perf_counter()
+        yield
+        # Client-side navigations return before their requests finish
+        settle(page, label=f"vitals {label}", timeout=5000)
+        self._add(label, (time.perf_counter() - start) * 1000, page.evaluate(COLLECT_JS, mark))
+
+    @asynccontextmanager
+    async def _navigation_async(self, page, label):
+        if page not in self._pages:
+            self._pages.add(page)
+            await page.add_init_script(VITALS_INIT_JS)
+        await page.evaluate(VITALS_INIT_JS)
+        mark = await page.evaluate(MARK_JS)
+        start = time.perf_counter()
+        yield
+        await settle_async(page, label=f"vitals {label}", timeout=5000)
+        self._add(label, (time.perf_counter() - start) * 1000, await page.evaluate(COLLECT_JS, mark))
+
+    def _add(self, label: str, duration_ms: float, sample: dict):
+        sample.update(label=label, duration_ms=duration_ms, recorded_at=time.time())
+        self.samples.append(sample)
+        print(f"📈 {label} ({sample['kind']}): {duration_ms:.0f} ms, LCP {sample['lcp_ms']}, "
+              f"CLS {sample['cls']:.3f}, {sample['resources']} resources")
+
+    def save(self):
+        if not self.samples:
+            return
+        with connect(self.path) as db:
+            db.executemany(
+                f"INSERT INTO navigations (run_id, commit_sha, recorded_at, label, url, kind, {', '.join(METRICS)}) "
+                f"VALUES ({', '.join('?' * (6 + len(METRICS)))})",
+                [(self.run_id, self.commit, s["recorded_at"], s["label"], s["url"], s["kind"],
+                  *(s[m] for m in METRICS)) for s in self.samples])
+        db.close()
+        self.samples.clear()
+
+
+vitals = VitalsRecorder()
+
+
+def welch_t(current: list, baseline: list) -> float:
+    """Welch's t statistic for current being larger than baseline (a single current sample is allowed)."""
+    var_c = statistics.variance(current) if len(current) > 1 else 0.0
+    var_b = statistics.variance(baseline) if len(baseline) > 1 else 0.0
+    diff = statistics.fmean(current) - statistics.fmean(baseline)
+    error = math.sqrt(var_c / len(current) + var_b / len(baseline))
+    if error == 0:
+        return math.inf if diff > 0 else 0.0
+    return diff / error
+
+
+def find_regressions(db: sqlite3.Connection, run_id: str = None, baseline_runs: int = 10,
+                     min_change: float = 0.1, t_threshold: float = 2.0) -> list:
+    """Compares run_id (default: the latest run) with the baseline_runs recorded before it."""
+    runs = [r for r, in db.execute(
+        "SELECT run_id FROM navigations GROUP BY run_id ORDER BY MIN(recorded_at) DESC")]
+    if not runs:
+        return []
+    run_id = run_id or runs[0]
+    baseline = runs[runs.index(run_id) + 1:][:baseline_runs]
+    if not baseline:
+        return []
+
+    def values(run_ids, label, metric):
+        marks = ", ".join("?" * len(run_ids))
+        return [v for v, in db.execute(
+            f"SELECT {metric} FROM navigations WHERE run_id IN ({marks}) AND label = ? AND {metric} IS NOT NULL",
+            (*run_ids, label))]
+
+    regressions = []
+    for label, in db.execute("SELECT DISTINCT label FROM navigations WHERE run_id = ?", (run_id,)):
+        for metric in METRICS:
+            current, base = values([run_id], label, metric), values(baseline, label, metric)
+            if not current or len(base) < 2:
+                continue
+            cur_mean, base_mean = statistics.fmean(current), statistics.fmean(base)
+            change = (cur_mean - base_mean) / base_mean if base_mean else (math.inf if cur_mean > 0 else 0.0)
+            t = welch_t(current, base)
+            if change > min_change and t > t_threshold:
+                regressions.append({"label": label, "metric": metric, "current": cur_mean, "baseline": base_mean,
+                                    "change": change, "t": t, "samples": (len(current), len(base))})
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--run", help="Run id to check (default: the latest)")
+    parser.add_argument("--baseline-runs", type=int, default=10)
+    parser.add_argument("--min-change", type=float, default=0.1, help="Minimum slowdown ratio (0.1 = +10%%)")
+    parser.add_argument("--t", type=float, default=2.0, help="Minimum Welch t statistic")
+    args = parser.parse_args(argv)
+
+    db = connect(args.db)
+    regressions = find_regressions(db, args.run, args.baseline_runs, args.min_change, args.t)
+    db.close()
+    if not regressions:
+        print("✅ No navigation regressions against the baseline.")
+        return 0
+    print(f"{'navigation':<28}{'metric':<16}{'current':>11}{'baseline':>11}{'change':>9}{'t':>7}")
+    for r in regressions:
+        print(f"{r['label']:<28}{r['metric']:<16}{r['current']:>11.1f}{r['baseline']:>11.1f}"
+              f"{r['change']:>+9.0%}{r['t']:>7.1f}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())